@@ -0,0 +1,209 @@
+"""
+Command line entry point for the documentation tooling.
+
+Usage:
+    python -m src.cli sync <source_repo_path> <destination_repo_path>
+    python -m src.cli summarize <markdown_file>
+    python -m src.cli cost [log_dir_or_file]
+    python -m src.cli plan <source_repo_path> --budget <usd>
+    python -m src.cli check-links <destination_repo_path>
+    python -m src.cli publish-assets <public_path> [--subset-fonts]
+    python -m src.cli bench [source_repo_path destination_repo_path]
+
+Each subcommand imports its modules only when it runs, so commands that do not
+call the model never load the Gemini SDK and startup stays cheap.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Time allowed for a no-op run of the CLI, measured by the 'bench' subcommand.
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+def run_sync(args):
+    from src.documentation.file_handler import FileHandler
+    from src.documentation.sync import sync_documentation
+
+    file_handler = FileHandler(args.source_repo_path, args.destination_repo_path,
+                               image_widths=args.image_widths, emit_webp=args.webp,
+                               use_asset_store=args.asset_store, related_pages_count=args.related)
+    result = sync_documentation(file_handler, max_workers=args.workers)
+    print(f"Pages rendered: {len(result['pages'])}")
+    print(f"Assets copied: {len(result['assets'])}")
+    print(f"Pages removed: {len(result['removed'])}")
+    return 0
+
+
+def run_summarize(args):
+    from src.documentation.generate_ai_content import generate_ai_content
+    from src.documentation.model_backend import FakeBackend, GeminiBackend, RecordingBackend
+
+    if args.fake:
+        backend = FakeBackend(recording_path=args.recording, first_chunk_latency=args.latency,
+                              chunk_latency=args.latency)
+    elif args.recording:
+        backend = RecordingBackend(GeminiBackend(), args.recording)
+    else:
+        backend = GeminiBackend()
+
+    with open(args.markdown_file, 'r', encoding='utf-8') as file:
+        markdown_text = file.read()
+    result = generate_ai_content(markdown_text, model_version=args.model, log_file_base_path=args.log_file,
+                                 backend=backend, compress_logs=args.compress_logs)
+    print("Summaries:")
+    for lang, summary in result["summaries"].items():
+        print(f"{lang}: {summary}")
+    print("Descriptions:")
+    for lang, description in result.get("descriptions", {}).items():
+        print(f"{lang}: {description}")
+    print(f"Total tokens: {result['tokens']['total_tokens']}")
+    return 0
+
+
+def run_cost(args):
+    from src.documentation.token_cost import process_log_files
+
+    process_log_files(args.log_path)
+    return 0
+
+
+def run_plan(args):
+    from src.documentation.run_planner import collect_documents, plan_run
+
+    plan = plan_run(collect_documents(args.source_repo_path), args.budget, model=args.model,
+                    allow_downgrade=not args.no_downgrade)
+    for item in plan["items"]:
+        print(f"{item['path']}: {item['model']} - Input tokens: {item['input_tokens']} "
+              f"Output tokens: {item['output_tokens']} - US$ {item['cost']:.6f}")
+    for path in plan["skipped"]:
+        print(f"{path}: skipped, budget exceeded")
+    print(f"Estimated cost: US$ {plan['total_cost']:.4f} of US$ {plan['budget']:.4f}")
+    return 0 if not plan["skipped"] else 1
+
+
+def run_check_links(args):
+    from src.documentation.link_checker import check_links
+
+    broken = check_links(args.destination_repo_path, max_workers=args.workers)
+    for item in broken:
+        print(f"{item['page']}: {item['target']} ({item['reason']})")
+    print(f"Broken references: {len(broken)}")
+    return 0 if not broken else 1
+
+
+def run_publish_assets(args):
+    from src.publish.static_assets import process_static_assets
+
+    if args.subset_fonts:
+        from src.publish.font_subset import subset_icon_fonts
+
+        subset = subset_icon_fonts(args.public_path)
+        print(f"Icons used: {', '.join(subset['icons']) or 'none'} ({subset['codepoints']} glyphs kept)")
+        for font_name, (full_size, subset_size) in subset['fonts'].items():
+            print(f"{font_name}: {full_size} -> {subset_size} bytes")
+
+    result = process_static_assets(args.public_path, max_workers=args.workers)
+    print(f"Fingerprinted assets: {len(result['manifest'])}")
+    print(f"Compressed files written: {len(result['compressed'])}")
+    return 0
+
+
+def run_bench(args):
+    if args.source_repo_path and args.destination_repo_path:
+        command = [sys.executable, '-m', 'src.cli', 'sync', args.source_repo_path, args.destination_repo_path]
+    else:
+        command = [sys.executable, '-m', 'src.cli', '--help']
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    print(f"Command: {' '.join(command[1:])}")
+    print(f"Runs: {len(timings)} - min: {min(timings):.3f}s median: {median:.3f}s max: {max(timings):.3f}s")
+    print(f"Budget: {args.budget:.3f}s - {'OK' if median <= args.budget else 'EXCEEDED'}")
+    return 0 if median <= args.budget else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='src.cli', description='Deployo documentation tooling.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    sync_parser = subparsers.add_parser('sync', help='Synchronize documentation into the Hugo content tree.')
+    sync_parser.add_argument('source_repo_path')
+    sync_parser.add_argument('destination_repo_path')
+    sync_parser.add_argument('--image-width', dest='image_widths', type=int, action='append', default=[],
+                             help='Width of a resized image variant; may be repeated.')
+    sync_parser.add_argument('--webp', action='store_true', help='Emit WebP variants of the images.')
+    sync_parser.add_argument('--asset-store', action='store_true',
+                             help='Store images once by content hash in static/assets.')
+    sync_parser.add_argument('--related', type=int, default=0,
+                             help='Number of related pages written to the front matter (requires NumPy).')
+    sync_parser.add_argument('--workers', type=int, default=None, help='Number of image worker processes.')
+    sync_parser.set_defaults(handler=run_sync)
+
+    summarize_parser = subparsers.add_parser('summarize', help='Generate summaries of a Markdown file.')
+    summarize_parser.add_argument('markdown_file')
+    summarize_parser.add_argument('--model', default='gemini-2.0-flash')
+    summarize_parser.add_argument('--log-file', default=None)
+    summarize_parser.add_argument('--compress-logs', action='store_true',
+                                  help='Gzip the log of each finished month.')
+    summarize_parser.add_argument('--fake', action='store_true',
+                                  help='Use the offline fake backend instead of the Gemini API.')
+    summarize_parser.add_argument('--recording', default=None,
+                                  help='Recording file: replayed with --fake, written otherwise.')
+    summarize_parser.add_argument('--latency', type=float, default=0.0,
+                                  help='Seconds of latency per chunk of the fake backend.')
+    summarize_parser.set_defaults(handler=run_summarize)
+
+    cost_parser = subparsers.add_parser('cost', help='Calculate the token cost from the log files.')
+    cost_parser.add_argument('log_path', nargs='?', default='logs')
+    cost_parser.set_defaults(handler=run_cost)
+
+    plan_parser = subparsers.add_parser('plan', help='Estimate the tokens and cost of a summarization run.')
+    plan_parser.add_argument('source_repo_path')
+    plan_parser.add_argument('--budget', type=float, required=True, help='Budget cap of the run in US$.')
+    plan_parser.add_argument('--model', default='gemini-2.0-flash')
+    plan_parser.add_argument('--no-downgrade', action='store_true',
+                             help='Stop instead of switching to a cheaper model.')
+    plan_parser.set_defaults(handler=run_plan)
+
+    check_links_parser = subparsers.add_parser('check-links',
+                                               help='Check the links and images of the Hugo content tree.')
+    check_links_parser.add_argument('destination_repo_path')
+    check_links_parser.add_argument('--workers', type=int, default=None, help='Number of reader threads.')
+    check_links_parser.set_defaults(handler=run_check_links)
+
+    publish_parser = subparsers.add_parser('publish-assets',
+                                           help='Fingerprint and precompress the assets of the Hugo build output.')
+    publish_parser.add_argument('public_path')
+    publish_parser.add_argument('--workers', type=int, default=None, help='Number of compression processes.')
+    publish_parser.add_argument('--subset-fonts', action='store_true',
+                                help='Subset the icon fonts to the icons used by the site first.')
+    publish_parser.set_defaults(handler=run_publish_assets)
+
+    bench_parser = subparsers.add_parser('bench', help='Measure the startup time of the CLI.')
+    bench_parser.add_argument('source_repo_path', nargs='?')
+    bench_parser.add_argument('destination_repo_path', nargs='?')
+    bench_parser.add_argument('--runs', type=int, default=5)
+    bench_parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_SECONDS)
+    bench_parser.set_defaults(handler=run_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import os
+
+ASSET_STORE_DIRECTORY = os.path.join('static', 'assets')
+ASSET_STORE_URL = '/assets'
+
+
+class AssetStore:
+    def __init__(self, destination_repo_path):
+        """
+        Initializes the content-addressed asset store of the Hugo site.
+        Assets are named by the SHA-256 of their content, so identical files referenced
+        from several repositories or languages are written only once.
+
+        :param destination_repo_path: Path to the Hugo site repository.
+        """
+        self.store_path = os.path.join(destination_repo_path, ASSET_STORE_DIRECTORY)
+
+    @staticmethod
+    def relative_path(content_hash, extension):
+        """
+        :return: Path of an asset inside the store, sharded by the first two hash characters.
+        """
+        return os.path.join(content_hash[:2], f"{content_hash}{extension.lower()}")
+
+    def path_for(self, content_hash, extension):
+        """
+        :param content_hash: SHA-256 of the asset content.
+        :param extension: File extension, including the dot.
+        :return: Path of the asset in the destination repository.
+        """
+        return os.path.join(self.store_path, self.relative_path(content_hash, extension))
+
+    def url_for(self, content_hash, extension):
+        """
+        :param content_hash: SHA-256 of the asset content.
+        :param extension: File extension, including the dot.
+        :return: URL of the asset in the published site.
+        """
+        return f"{ASSET_STORE_URL}/{self.relative_path(content_hash, extension).replace(os.sep, '/')}"
+
+    def remove_unreferenced(self, content_hashes):
+        """
+        Deletes the stored assets, and their variants, whose hash is not referenced anymore.
+
+        :param content_hashes: Hashes of the assets still referenced by some page.
+        :return: List of removed paths.
+        """
+        removed = []
+        if not os.path.isdir(self.store_path):
+            return removed
+        for root, _, files in os.walk(self.store_path):
+            for file_name in files:
+                content_hash = file_name.split('.', 1)[0].split('-', 1)[0]
+                if content_hash not in content_hashes:
+                    file_path = os.path.join(root, file_name)
+                    os.remove(file_path)
+                    removed.append(file_path)
+        return removed
@@ -0,0 +1,98 @@
+import json
+import os
+
+from src.utils import atomic_write
+
+
+class DependencyGraph:
+    def __init__(self, state_path):
+        """
+        Initializes the dependency graph persisted in the given JSON file.
+        Each page records its own content hash and the hashes of the files it references,
+        so a page is only re-rendered when it or one of its dependencies changed.
+
+        :param state_path: Path to the JSON file holding the graph between runs.
+        """
+        self.state_path = state_path
+        self.pages = {}
+        self.assets = {}
+
+    def load(self):
+        """
+        Loads the graph saved by a previous run, if any.
+        """
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+            self.pages = state.get('pages', {})
+            self.assets = state.get('assets', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error while loading dependency graph '{self.state_path}': {e}")
+
+    def save(self):
+        """
+        Writes the graph to its JSON file.
+        """
+        state_dir = os.path.dirname(self.state_path)
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+        atomic_write(self.state_path, json.dumps({'pages': self.pages, 'assets': self.assets}, indent=2, sort_keys=True))
+
+    def is_page_stale(self, page, page_hash, dependency_hashes):
+        """
+        Determines if a page must be re-rendered.
+
+        :param page: Source path of the page.
+        :param page_hash: Current content hash of the page.
+        :param dependency_hashes: Dictionary of referenced source path to its current hash.
+        :return: True if the page or any of its dependencies changed since the last run.
+        """
+        entry = self.pages.get(page)
+        return entry is None or entry['hash'] != page_hash or entry['dependencies'] != dependency_hashes
+
+    def update_page(self, page, page_hash, dependency_hashes, destination=None):
+        """
+        Records the hashes a page was rendered with and the destination it was written to.
+        """
+        self.pages[page] = {'hash': page_hash, 'dependencies': dict(dependency_hashes), 'destination': destination}
+
+    def is_asset_stale(self, asset, asset_hash):
+        """
+        Determines if an asset must be copied again.
+        """
+        return self.assets.get(asset) != asset_hash
+
+    def update_asset(self, asset, asset_hash):
+        """
+        Records the hash an asset was copied with.
+        """
+        self.assets[asset] = asset_hash
+
+    def remove_missing_pages(self, pages):
+        """
+        Drops the pages that are no longer present in the source repository.
+
+        :param pages: Source paths of the pages found in this run.
+        :return: Sorted list of the destination paths of the dropped pages.
+        """
+        destinations = []
+        for page in set(self.pages) - set(pages):
+            destination = self.pages.pop(page).get('destination')
+            if destination:
+                destinations.append(destination)
+        return sorted(destinations)
+
+    def referenced_files(self):
+        """
+        :return: Set of source paths referenced by at least one page.
+        """
+        return {dependency for entry in self.pages.values() for dependency in entry['dependencies']}
+
+    def dependents(self, dependency):
+        """
+        :param dependency: Source path of a referenced file.
+        :return: Sorted list of pages referencing the file.
+        """
+        return sorted(page for page, entry in self.pages.items() if dependency in entry['dependencies'])
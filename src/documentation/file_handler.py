@@ -1,12 +1,29 @@
+import errno
 import os
+import shutil
 import sys
-from src.utils import camel_to_kebab
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from src.utils import atomic_copy, camel_to_kebab, file_sha256
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+IMAGE_CACHE_DIRECTORY = os.path.join('.cache', 'images')
 
 class FileHandler:
-    def __init__(self, source_repo_path, destination_repo_path, update_all_fields=False):
+    def __init__(self, source_repo_path, destination_repo_path, update_all_fields=False,
+                 image_widths=(), emit_webp=False, use_asset_store=False, related_pages_count=0):
         self.source_repo_path = source_repo_path
         self.destination_repo_path = destination_repo_path
         self.update_all_fields = update_all_fields
+        self.image_widths = tuple(image_widths)
+        self.emit_webp = emit_webp
+        self.use_asset_store = use_asset_store
+        self.related_pages_count = related_pages_count
+        self.image_cache_path = os.path.join(destination_repo_path, IMAGE_CACHE_DIRECTORY)
 
 def should_traverse_directory(directory_name):
     """
@@ -53,6 +70,161 @@ def handle_png(source_file_path, destination_file_path):
         print(f"Error copying PNG file from '{source_file_path}' to '{destination_file_path}': {e}", file=sys.stderr)
 
 
+def image_variant_paths(destination_file_path, widths=(), emit_webp=False):
+    """
+    Maps the name of each image variant in the cache to its destination path.
+
+    :param destination_file_path: Path to the destination PNG file.
+    :param widths: Widths in pixels of the resized variants for srcset.
+    :param emit_webp: If True, WebP variants are produced alongside the PNGs.
+    :return: Dictionary of cache file name to destination path.
+    """
+    base, _ = os.path.splitext(destination_file_path)
+    variants = {'optimized.png': destination_file_path}
+    if emit_webp:
+        variants['optimized.webp'] = f"{base}.webp"
+    for width in widths:
+        variants[f"{width}w.png"] = f"{base}-{width}w.png"
+        if emit_webp:
+            variants[f"{width}w.webp"] = f"{base}-{width}w.webp"
+    return variants
+
+
+def render_image_variants(source_file_path, cache_entry_path, widths=(), emit_webp=False):
+    """
+    Losslessly recompresses a PNG and renders its WebP and resized variants into a cache entry.
+    The recompressed PNG falls back to the original bytes when it is not smaller.
+    The variants are rendered into a temporary directory renamed to the cache entry, so an
+    interrupted run never leaves a partial entry that later runs would reuse. An existing entry
+    (e.g. one lacking widths added later, or one written meanwhile by another worker) is never
+    removed, since another worker may be copying from it: each variant is moved into it instead.
+
+    :param source_file_path: Path to the source PNG file.
+    :param cache_entry_path: Directory where the variants are written.
+    :param widths: Widths in pixels of the resized variants.
+    :param emit_webp: If True, WebP variants are produced alongside the PNGs.
+    """
+    cache_path = os.path.dirname(cache_entry_path)
+    os.makedirs(cache_path, exist_ok=True)
+    temp_path = tempfile.mkdtemp(dir=cache_path, prefix='.tmp-')
+    try:
+        optimized_path = os.path.join(temp_path, 'optimized.png')
+        with Image.open(source_file_path) as image:
+            image.save(optimized_path, format='PNG', optimize=True)
+            if os.path.getsize(optimized_path) >= os.path.getsize(source_file_path):
+                shutil.copyfile(source_file_path, optimized_path)
+            if emit_webp:
+                image.save(os.path.join(temp_path, 'optimized.webp'), format='WEBP', lossless=True)
+
+            for width in widths:
+                if width < image.width:
+                    height = max(1, round(image.height * width / image.width))
+                    variant = image.resize((width, height), Image.LANCZOS)
+                else:
+                    variant = image
+                variant.save(os.path.join(temp_path, f"{width}w.png"), format='PNG', optimize=True)
+                if emit_webp:
+                    variant.save(os.path.join(temp_path, f"{width}w.webp"), format='WEBP', lossless=True)
+
+        try:
+            os.rename(temp_path, cache_entry_path)
+        except OSError as e:
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY) or not os.path.isdir(cache_entry_path):
+                raise
+            for name in os.listdir(temp_path):
+                os.replace(os.path.join(temp_path, name), os.path.join(cache_entry_path, name))
+    finally:
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+
+def optimize_image(source_file_path, destination_file_path, cache_path, widths=(), emit_webp=False):
+    """
+    Writes the optimized PNG and its variants to the destination, reusing the outputs
+    cached under the SHA-256 of the source content. Without Pillow the PNG is copied as is.
+    Files are written through a temporary file, so an interrupted copy leaves no partial image.
+
+    :param source_file_path: Path to the source PNG file.
+    :param destination_file_path: Path to the destination PNG file.
+    :param cache_path: Root directory of the image cache.
+    :param widths: Widths in pixels of the resized variants.
+    :param emit_webp: If True, WebP variants are produced alongside the PNGs.
+    :return: List of destination paths written.
+    """
+    try:
+        if Image is None:
+            atomic_copy(source_file_path, destination_file_path)
+            return [destination_file_path]
+
+        cache_entry_path = os.path.join(cache_path, file_sha256(source_file_path))
+        variants = image_variant_paths(destination_file_path, widths, emit_webp)
+        if not all(os.path.exists(os.path.join(cache_entry_path, name)) for name in variants):
+            try:
+                render_image_variants(source_file_path, cache_entry_path, widths, emit_webp)
+            except Image.UnidentifiedImageError:
+                # Not an image Pillow can read: published unchanged, without variants.
+                atomic_copy(source_file_path, destination_file_path)
+                return [destination_file_path]
+
+        for name, variant_destination_path in variants.items():
+            atomic_copy(os.path.join(cache_entry_path, name), variant_destination_path)
+        return list(variants.values())
+    except FileNotFoundError:
+        print(f"File not found: {source_file_path}", file=sys.stderr)
+    except OSError as e:
+        print(f"Error optimizing PNG file from '{source_file_path}' to '{destination_file_path}': {e}", file=sys.stderr)
+    return []
+
+
+def group_images_by_content(image_paths):
+    """
+    Groups images by the SHA-256 of their content, so identical images (e.g. the same diagram
+    under both languages) share a single cache entry. Unreadable files form their own group.
+
+    :param image_paths: List of (source_file_path, destination_file_path) tuples.
+    :return: List of groups, each a list of (source_file_path, destination_file_path) tuples.
+    """
+    groups = {}
+    for source, destination in image_paths:
+        try:
+            key = file_sha256(source)
+        except OSError:
+            key = source
+        groups.setdefault(key, []).append((source, destination))
+    return list(groups.values())
+
+
+def optimize_images(self, image_paths, max_workers=None):
+    """
+    Optimizes several PNG files in a process pool.
+    Each distinct content is rendered by a single worker, since workers rendering the same
+    cache entry would race on it; the other copies are then written from the cache.
+
+    :param self: Instance of the class.
+    :param image_paths: List of (source_file_path, destination_file_path) tuples.
+    :param max_workers: Number of worker processes (default: number of CPUs).
+    :return: Dictionary of source path to the list of destination paths written.
+    """
+    groups = group_images_by_content(image_paths)
+    arguments = [
+        (group[0][0], group[0][1], self.image_cache_path, self.image_widths, self.emit_webp)
+        for group in groups
+    ]
+    if len(arguments) <= 1 or Image is None:
+        results = [optimize_image(*argument) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(optimize_image, *zip(*arguments)))
+
+    written_paths = {}
+    for group, written in zip(groups, results):
+        written_paths[group[0][0]] = written
+        for source, destination in group[1:]:
+            written_paths[source] = optimize_image(source, destination, self.image_cache_path,
+                                                   self.image_widths, self.emit_webp)
+    return written_paths
+
+
 def build_destination_path(self, source_path):
     """
     Build the destination path based on the source path and the defined rules.
@@ -0,0 +1,137 @@
+import copy
+import os
+from collections import OrderedDict
+from datetime import datetime
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+FRONT_MATTER_DELIMITER = '---'
+
+# Least recently used entries are dropped beyond this size; a site has a few thousand pages.
+FRONT_MATTER_CACHE_SIZE = 4096
+
+# Keyed by absolute path; each entry holds the (mtime, size) it was parsed at and the front matter.
+_front_matter_cache = OrderedDict()
+
+
+def _datetime_representer(dumper, data):
+    return dumper.represent_scalar('tag:yaml.org,2002:timestamp', data.isoformat())
+
+
+# Registered once at import time instead of on every dump.
+SafeDumper.add_representer(datetime, _datetime_representer)
+
+
+def load_front_matter(text):
+    """
+    Parses a YAML front matter block.
+
+    :param text: YAML text found between the '---' delimiters.
+    :return: Dictionary with the front matter, empty if there is none.
+    """
+    return yaml.load(text, Loader=SafeLoader) or {}
+
+
+def dump_front_matter(data):
+    """
+    Serializes a dictionary as a YAML front matter block, delimiters not included.
+
+    :param data: Dictionary with the front matter fields.
+    :return: YAML text.
+    """
+    return yaml.dump(data, Dumper=SafeDumper, default_flow_style=False)
+
+
+def read_front_matter_block(file_path):
+    """
+    Reads only the leading '---' block of a file, stopping at the closing delimiter.
+
+    :param file_path: Path to the Markdown file.
+    :return: The YAML text of the block, or None if the file has no front matter.
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        first_line = file.readline()
+        if first_line.rstrip('\r\n') != FRONT_MATTER_DELIMITER:
+            return None
+        lines = []
+        for line in file:
+            if line.rstrip('\r\n') == FRONT_MATTER_DELIMITER:
+                return ''.join(lines)
+            lines.append(line)
+    return None
+
+
+def read_front_matter(file_path):
+    """
+    Returns the parsed front matter of a file, using a cache keyed by path and checked
+    against the mtime and size of the file. A deep copy is returned so callers may change
+    it, nested values included, without touching the cache.
+
+    :param file_path: Path to the Markdown file.
+    :return: Dictionary with the front matter, empty if there is none.
+    """
+    path = os.fspath(file_path)
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _front_matter_cache.get(key)
+    if entry is not None and entry[0] == version:
+        _front_matter_cache.move_to_end(key)
+        front_matter = entry[1]
+    else:
+        block = read_front_matter_block(path)
+        front_matter = load_front_matter(block) if block is not None else {}
+        _front_matter_cache[key] = (version, front_matter)
+        _front_matter_cache.move_to_end(key)
+        while len(_front_matter_cache) > FRONT_MATTER_CACHE_SIZE:
+            _front_matter_cache.popitem(last=False)
+    return copy.deepcopy(front_matter)
+
+
+def split_front_matter_block(content):
+    """
+    Splits a document into its YAML front matter text and body, without parsing the YAML.
+
+    :param content: Full text of the Markdown document.
+    :return: Tuple (block, body), where block is None if the document has no front matter.
+    """
+    if content.startswith(FRONT_MATTER_DELIMITER + '\n'):
+        end = content.find('\n' + FRONT_MATTER_DELIMITER + '\n', len(FRONT_MATTER_DELIMITER))
+        if end != -1:
+            block = content[len(FRONT_MATTER_DELIMITER) + 1:end + 1]
+            body = content[end + len(FRONT_MATTER_DELIMITER) + 2:]
+            return block, body
+    return None, content
+
+
+def split_front_matter(content):
+    """
+    Splits a document into its front matter dictionary and body.
+
+    :param content: Full text of the Markdown document.
+    :return: Tuple (front_matter, body).
+    """
+    block, body = split_front_matter_block(content)
+    return (load_front_matter(block) if block is not None else {}), body
+
+
+def join_front_matter(front_matter, body):
+    """
+    Builds a document from its front matter dictionary and body.
+
+    :param front_matter: Dictionary with the front matter fields.
+    :param body: Markdown body.
+    :return: Full text of the document.
+    """
+    return f"{FRONT_MATTER_DELIMITER}\n{dump_front_matter(front_matter)}{FRONT_MATTER_DELIMITER}\n{body}"
+
+
+def clear_front_matter_cache():
+    """Drops every cached front matter entry."""
+    _front_matter_cache.clear()
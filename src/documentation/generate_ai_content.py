@@ -1,43 +1,13 @@
 import os
 import logging
-from logging.handlers import TimedRotatingFileHandler
-from pathlib import Path
-from google import genai
-from google.genai import types
-
-_log_configured = False;
-
-def setup_logging(log_file_base_path):
-    global _log_configured
-
-    if _log_configured:
-        return
-    """Configura o logging com rotação mensal no caminho especificado."""
-    # Criação do diretório, caso não exista
-    log_dir = os.path.dirname(log_file_base_path)
-    if log_dir:
-        Path(log_dir).mkdir(parents=True, exist_ok=True)
-    print (f"Log file base path: {log_file_base_path}")
-    # Configuração do handler de rotação
-    log_handler = TimedRotatingFileHandler(
-        filename=log_file_base_path,
-        when='M',  # Rotação mensal
-        interval=1,
-        backupCount=12,  # Manter os últimos 12 meses de logs
-        utc=True  # Garantir que o UTC seja usado
-    )
-    log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    log_handler.suffix = "%Y-%m"  # Extensão do arquivo de rotação
-
-    # Configurar logger root manualmente
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-
-    # Evitar duplicação de handlers
-    if not logger.hasHandlers():
-        print("Setting up logging...")
-        logger.addHandler(log_handler)
+from src.documentation.model_backend import GeminiBackend
+from src.logging_config import setup_logging
 
+SYSTEM_INSTRUCTION = """For each provided Markdown text:
+    - write "summaries" and skip a line
+    - generate a summary in Portuguese (pt-br) and English (en), each 40-60 words, without titles like 'Sumário' or 'Summary'. Return the result as plain text with 'pt-br:' followed by the Portuguese summary, then 'en:' followed by the English summary, separated by a newline.
+    - write "descriptions" and skip a line
+    - generate a page description in Portuguese (pt-br) and English (en), each about 20 words, without titles like 'Descrição' or 'Description'. Return the result as plain text with 'pt-br:' followed by the Portuguese page description, then 'en:' followed by the English page description, separated by a newline."""
 
 
 def extract_markdown_title(markdown_text):
@@ -48,7 +18,8 @@ def extract_markdown_title(markdown_text):
     return "Untitled"
 
 
-def generate_ai_content(markdown_text, model_version="gemini-2.0-flash", log_file_base_path=None):
+def generate_ai_content(markdown_text, model_version="gemini-2.0-flash", log_file_base_path=None, backend=None,
+                        compress_logs=False):
     """
     Generates summarized content and page descriptions in both Portuguese (pt-br) and English (en) based on the provided Markdown text.
     
@@ -57,6 +28,9 @@ def generate_ai_content(markdown_text, model_version="gemini-2.0-flash", log_fil
         model_version (str): The version of the AI model to use (default is "gemini-2.0-flash").
         log_file_base_path (str or None): The file path for logging. If not provided, defaults to the "LOG_FILE_PATH" environment variable 
                                           or "summary_generator.log".
+        backend (ModelBackend or None): The model backend to call. Defaults to GeminiBackend; use
+                                        FakeBackend to run without an API key.
+        compress_logs (bool): If True, the log of each finished month is gzip compressed.
     
     Returns:
         dict: A dictionary containing:
@@ -65,46 +39,21 @@ def generate_ai_content(markdown_text, model_version="gemini-2.0-flash", log_fil
             - "total_tokens" (int): The total number of tokens consumed during processing.
     """
     log_file_base_path = log_file_base_path or os.environ.get("LOG_FILE_PATH", "summary_generator.log")
-    setup_logging(log_file_base_path)
+    setup_logging(log_file_base_path, compress=compress_logs)
     logger = logging.getLogger(__name__)
 
-    client = genai.Client(
-        api_key=os.environ.get("GEMINI_API_KEY"),
-    )
+    backend = backend or GeminiBackend()
 
     method_name = "generate_summary"
     markdown_title = extract_markdown_title(markdown_text)
     logger.info(f"Starting {method_name} for Markdown titled '{markdown_title}' with model '{model_version}'")
 
-    contents = [
-        types.Content(
-            role="user",
-            parts=[
-                types.Part.from_text(text=markdown_text),
-            ],
-        ),
-    ]
-    generate_content_config = types.GenerateContentConfig(
-        response_mime_type="text/plain",
-        system_instruction=[
-            types.Part.from_text(text="""For each provided Markdown text:
-    - write "summaries" and skip a line
-    - generate a summary in Portuguese (pt-br) and English (en), each 40-60 words, without titles like 'Sumário' or 'Summary'. Return the result as plain text with 'pt-br:' followed by the Portuguese summary, then 'en:' followed by the English summary, separated by a newline.
-    - write "descriptions" and skip a line
-    - generate a page description in Portuguese (pt-br) and English (en), each about 20 words, without titles like 'Descrição' or 'Description'. Return the result as plain text with 'pt-br:' followed by the Portuguese page description, then 'en:' followed by the English page description, separated by a newline."""),
-        ],
-    )
-
     full_response = ""
     total_tokens = 0
     input_tokens = 0
     output_tokens = 0
 
-    for chunk in client.models.generate_content_stream(
-        model=model_version,
-        contents=contents,
-        config=generate_content_config,
-    ):
+    for chunk in backend.generate_content_stream(model_version, markdown_text, SYSTEM_INSTRUCTION):
         full_response += chunk.text
         if hasattr(chunk, 'usage_metadata') and chunk.usage_metadata:
             input_tokens += chunk.usage_metadata.prompt_token_count or 0
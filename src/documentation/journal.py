@@ -0,0 +1,77 @@
+import json
+import os
+
+
+class SyncJournal:
+    def __init__(self, journal_path):
+        """
+        Initializes the write-ahead journal of a sync run.
+        Every completed work item is appended and flushed to disk as one JSON line, so a run
+        interrupted by an error or Ctrl-C can be resumed without redoing finished items.
+        The journal is cleared once the run completes.
+
+        :param journal_path: Path to the JSON lines file of the journal.
+        """
+        self.journal_path = journal_path
+        self.items = {}
+
+    def load(self):
+        """
+        Loads the items completed by an interrupted run. A truncated last line is removed from
+        the file, so the items recorded by the resumed run start on a line of their own.
+        """
+        try:
+            with open(self.journal_path, 'rb+') as file:
+                content = file.read()
+                complete_length = content.rfind(b'\n') + 1
+                if complete_length < len(content):
+                    file.truncate(complete_length)
+        except FileNotFoundError:
+            return
+        for line in content[:complete_length].decode('utf-8', errors='replace').splitlines():
+            try:
+                item = json.loads(line)
+            except ValueError:
+                continue
+            self.items[item['source']] = item
+
+    def record(self, source, source_hash, destination, result=None):
+        """
+        Appends a completed work item and flushes it to disk.
+
+        :param source: Source path of the item.
+        :param source_hash: Content hash of the source when the item was processed.
+        :param destination: Destination path written by the item.
+        :param result: Reference to the result of the item, e.g. the file holding an AI response (optional).
+        """
+        item = {'source': source, 'source_hash': source_hash, 'destination': destination, 'result': result}
+        journal_dir = os.path.dirname(self.journal_path)
+        if journal_dir:
+            os.makedirs(journal_dir, exist_ok=True)
+        with open(self.journal_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(item, ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        self.items[source] = item
+
+    def completed(self, source, source_hash, destination):
+        """
+        Determines if a work item was completed by the interrupted run with the same
+        source content and its destination is still present.
+
+        :return: The journal item, or None if the item must be processed.
+        """
+        item = self.items.get(source)
+        if item is None or item['source_hash'] != source_hash or item['destination'] != destination:
+            return None
+        if not os.path.exists(destination):
+            return None
+        return item
+
+    def clear(self):
+        """
+        Removes the journal after a completed run.
+        """
+        self.items = {}
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
@@ -0,0 +1,131 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from src.documentation.asset_store import ASSET_STORE_URL, ASSET_STORE_DIRECTORY
+from src.documentation.markdown import LINK_TEXT_PATTERN, LINK_TARGET_PATTERN, LINK_TITLE_PATTERN
+
+FRONT_MATTER_PATTERN = re.compile(r'\A---\n.*?\n---\n', re.DOTALL)
+HEADING_PATTERN = re.compile(r'#{1,6}[ \t]+(.*?)[ \t]*#*[ \t]*$')
+# Same targets as markdown.LINK_PATTERN, built from its parts but without the optional '!',
+# so the pattern starts with a literal '[' and the regex engine can skip ahead.
+TARGET_PATTERN = re.compile(LINK_TEXT_PATTERN + LINK_TARGET_PATTERN + LINK_TITLE_PATTERN)
+CODE_BLOCK_PATTERN = re.compile(r'^[ \t]*(```|~~~).*?^[ \t]*\1[^\n]*$', re.MULTILINE | re.DOTALL)
+HEADING_ID_PATTERN = re.compile(r'\s*\{#([^}]+)\}$')
+EXTERNAL_PATTERN = re.compile(r'^[a-z][a-z0-9+.-]*:', re.IGNORECASE)
+
+
+def heading_anchor(heading):
+    """
+    Builds the anchor Hugo generates for a heading, or its explicit {#id}.
+
+    :param heading: Text of the heading, without the leading '#'.
+    :return: The anchor of the heading.
+    """
+    explicit_id = HEADING_ID_PATTERN.search(heading)
+    if explicit_id:
+        return explicit_id.group(1)
+    text = re.sub(r'[`*_]|\[([^\]]*)\]\([^)]*\)', r'\1', heading).strip().lower()
+    text = re.sub(r'[^\w\s-]', '', text, flags=re.UNICODE)
+    return re.sub(r'\s', '-', text)
+
+
+def parse_page(page_path):
+    """
+    Reads a Markdown page once and collects its heading anchors and link targets,
+    ignoring fenced code blocks.
+
+    :param page_path: Path to the Markdown page.
+    :return: Tuple (page_path, anchors, targets).
+    """
+    with open(page_path, 'r', encoding='utf-8') as file:
+        body = FRONT_MATTER_PATTERN.sub('', file.read(), count=1)
+
+    if '```' in body or '~~~' in body:
+        body = CODE_BLOCK_PATTERN.sub('', body)
+    anchors = set()
+    anchor_counts = {}
+    for line in body.split('\n'):
+        heading = HEADING_PATTERN.match(line) if line.startswith('#') else None
+        if heading:
+            anchor = heading_anchor(heading.group(1))
+            count = anchor_counts.get(anchor, 0)
+            anchor_counts[anchor] = count + 1
+            anchors.add(anchor if count == 0 else f"{anchor}-{count}")
+    targets = TARGET_PATTERN.findall(body)
+    return page_path, anchors, targets
+
+
+def list_files(directory):
+    """
+    :return: Set of the normalized paths of every file under a directory.
+    """
+    files = set()
+    for root, _, file_names in os.walk(directory):
+        files.update(os.path.normpath(os.path.join(root, file_name)) for file_name in file_names)
+    return files
+
+
+def find_target_file(page_dir, target, static_path, files):
+    """
+    Resolves a link target to a file of the index, trying the pages a Hugo URL may refer to.
+
+    :param page_dir: Directory of the page containing the link.
+    :param target: Link target without anchor.
+    :param static_path: Path to the asset store in the site repository.
+    :param files: Index of the files of the site.
+    :return: The file path, '' when no file matches, or None when the target is not
+             checked (external URL or site path outside the asset store).
+    """
+    if target.startswith(ASSET_STORE_URL + '/'):
+        path = os.path.normpath(os.path.join(static_path, target[len(ASSET_STORE_URL) + 1:]))
+    elif target.startswith('/') or EXTERNAL_PATTERN.match(target):
+        return None
+    else:
+        path = os.path.normpath(os.path.join(page_dir, target))
+    for candidate in (path, f"{path}.md", os.path.join(path, '_index.md'), os.path.join(path, 'index.md')):
+        if candidate in files:
+            return candidate
+    return ''
+
+
+def check_links(destination_repo_path, max_workers=None):
+    """
+    Checks every link and image reference of the Hugo content tree against an index of
+    the generated files and the heading anchors of each page. Pages are read once, in
+    parallel; the references are then checked with set lookups.
+
+    :param destination_repo_path: Path to the Hugo site repository.
+    :param max_workers: Number of reader threads.
+    :return: List of broken references as dictionaries with 'page', 'target' and 'reason', sorted by page.
+    """
+    content_path = os.path.join(destination_repo_path, 'content')
+    static_path = os.path.join(destination_repo_path, ASSET_STORE_DIRECTORY)
+    files = list_files(content_path) | list_files(static_path)
+    pages = sorted(path for path in files if path.endswith('.md'))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parsed_pages = list(executor.map(parse_page, pages))
+    anchors = {page_path: page_anchors for page_path, page_anchors, _ in parsed_pages}
+
+    resolved_targets = {}
+    broken = []
+    for page_path, _, targets in parsed_pages:
+        page_dir = os.path.dirname(page_path)
+        for target in targets:
+            path, _, anchor = target.partition('#')
+            if not path:
+                resolved = page_path
+            else:
+                key = (page_dir, path)
+                if key not in resolved_targets:
+                    resolved_targets[key] = find_target_file(page_dir, path, static_path, files)
+                resolved = resolved_targets[key]
+                if resolved is None:
+                    continue
+                if not resolved:
+                    broken.append({'page': page_path, 'target': target, 'reason': 'missing file'})
+                    continue
+            if anchor and resolved in anchors and anchor not in anchors[resolved]:
+                broken.append({'page': page_path, 'target': target, 'reason': 'missing anchor'})
+    return broken
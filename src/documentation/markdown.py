@@ -1,23 +1,106 @@
 import os
-import yaml
+import re
 
 from src.git_client import GitClient
+from src.documentation.file_handler import build_destination_path
+from src.documentation.front_matter import read_front_matter, dump_front_matter
 from datetime import datetime
 
+# Parts of a Markdown link, shared with the link checker so rewriting and checking find the same targets.
+LINK_TEXT_PATTERN = r'\[[^\]]*\]\(\s*'
+LINK_TARGET_PATTERN = r'<?([^)\s>]+)>?'
+LINK_TITLE_PATTERN = r'(?:\s+"[^"]*")?\s*\)'
+# Matches [text](target) and ![alt](target "title"), capturing the target.
+LINK_PATTERN = re.compile(rf'(!?{LINK_TEXT_PATTERN}){LINK_TARGET_PATTERN}({LINK_TITLE_PATTERN})')
+
+
+def is_local_reference(target):
+    """
+    Determines if a link target points to a file inside the source repository.
+
+    :param target: Target of a Markdown link or image.
+    :return: True for relative file references, False for URLs, anchors and absolute paths.
+    """
+    return not (target.startswith(('#', '/', 'mailto:')) or '://' in target)
+
+
+def extract_references(text):
+    """
+    Extracts the local link and image targets of a Markdown text, without anchors.
+
+    :param text: Markdown text.
+    :return: List of relative targets in order of appearance, without duplicates.
+    """
+    references = []
+    for match in LINK_PATTERN.finditer(text):
+        target = match.group(2).split('#', 1)[0]
+        if target and is_local_reference(target) and target not in references:
+            references.append(target)
+    return references
+
+
+def resolve_references(source_file, references):
+    """
+    Resolves relative targets against the directory of the file that references them.
+
+    :param source_file: Path to the Markdown file containing the references.
+    :param references: Relative targets as returned by extract_references.
+    :return: List of normalized source paths.
+    """
+    source_dir = os.path.dirname(os.fspath(source_file))
+    return [os.path.normpath(os.path.join(source_dir, reference)) for reference in references]
+
+
+def rewrite_references(text, source_file, target_file, file_handler, asset_urls=None):
+    """
+    Rewrites local link and image targets to the destination paths built by build_destination_path,
+    relative to the directory of the target file. Targets that do not exist are kept unchanged.
+
+    :param text: Markdown text.
+    :param source_file: Path to the source Markdown file.
+    :param target_file: Path to the target Markdown file.
+    :param file_handler: FileHandler used to build the destination paths.
+    :param asset_urls: Dictionary of source path to the URL of the asset in the asset store (optional).
+    :return: Markdown text with the rewritten targets.
+    """
+    source_dir = os.path.dirname(os.fspath(source_file))
+    target_dir = os.path.dirname(os.fspath(target_file))
+
+    def replace(match):
+        path, separator, anchor = match.group(2).partition('#')
+        if not path or not is_local_reference(path):
+            return match.group(0)
+        referenced_source = os.path.normpath(os.path.join(source_dir, path))
+        if not os.path.exists(referenced_source):
+            return match.group(0)
+        if asset_urls and referenced_source in asset_urls:
+            return f"{match.group(1)}{asset_urls[referenced_source]}{separator}{anchor}{match.group(3)}"
+        destination = build_destination_path(file_handler, referenced_source)
+        relative_destination = os.path.relpath(destination, target_dir).replace(os.sep, '/')
+        return f"{match.group(1)}{relative_destination}{separator}{anchor}{match.group(3)}"
+
+    return LINK_PATTERN.sub(replace, text)
+
+
 class Markdown:
-    def __init__(self, source_file, target_file, source_repo_path):
+    def __init__(self, source_file, target_file, source_repo_path, file_handler=None, asset_urls=None):
         """
         Initializes the Markdown object with given source and target files.
         If the target file exists, extracts the Hugo front matter.
 
         :param source_file: Path to the source file.
         :param target_file: Path to the target file.
+        :param file_handler: FileHandler used to rewrite references to destination paths (optional).
+        :param asset_urls: Dictionary of source path to asset store URL used for those references (optional).
         """
         self.source_file = source_file
         self.target_file = target_file
         self.source_repo_path = source_repo_path
+        self.file_handler = file_handler
+        self.asset_urls = asset_urls
         self.content = ''
         self.front_matter = {}
+        self.references = []
 
         if os.path.exists(self.target_file):
             self.extract_front_matter()
@@ -27,14 +110,7 @@ class Markdown:
         Reads the Hugo front matter from the target file and stores it as a dictionary.
         """
         try:
-            with open(self.target_file, 'r', encoding='utf-8') as file:
-                content = file.read()
-
-            if content.startswith("---"):
-                parts = content.split('---', 2)
-                if len(parts) > 1:
-                    self.front_matter = yaml.safe_load(parts[1]) or {}
-
+            self.front_matter = read_front_matter(self.target_file)
         except Exception as e:
             print(f"Error while extracting front matter: {e}")
             
@@ -42,8 +118,16 @@ class Markdown:
         return self.content
 
     def merge_files(self):
-        creation_info = GitClient().get_file_creation_info(self.source_file)
-        created_at = datetime.strptime(creation_info.get('created_at'), '%Y-%m-%dT%H:%M:%S')
+        source_file = os.path.abspath(self.source_file)
+        creation_info = GitClient(self.source_repo_path).get_file_creation_info(source_file)
+        if creation_info and creation_info.get('creation_date'):
+            # 'git log --date=iso' format, e.g. '2023-11-02 10:00:00 +0000'.
+            created_at = datetime.strptime(creation_info['creation_date'], '%Y-%m-%d %H:%M:%S %z')
+            author = creation_info.get('author')
+        else:
+            # Not committed yet: the file is dated by its modification time.
+            created_at = datetime.fromtimestamp(os.path.getmtime(source_file)).replace(microsecond=0)
+            author = None
 
         first_title = None
         comment_started = False
@@ -66,20 +150,20 @@ class Markdown:
                     continue
                 lines_to_keep.append(line)
 
-        self.content = "\n".join(lines_to_keep)
+        self.content = "".join(lines_to_keep)
+        self.references = resolve_references(self.source_file, extract_references(self.content))
+        if self.file_handler is not None:
+            self.content = rewrite_references(self.content, self.source_file, self.target_file,
+                                              self.file_handler, self.asset_urls)
         data_frontmatter = {
             'date': created_at,
             'title': first_title,
             'params': {
-                'author': creation_info.get('author')
+                'author': author
             },
         }
 
-        def datetime_representer(dumper, data):
-            return dumper.represent_scalar('tag:yaml.org,2002:timestamp', data.isoformat())
-        yaml.SafeDumper.add_representer(datetime, datetime_representer)
-
-        front_matter_str = yaml.dump(data_frontmatter, Dumper=yaml.SafeDumper, default_flow_style=False)
+        front_matter_str = dump_front_matter(data_frontmatter)
 
         # Merge front matter and content
         self.content = f"---\n{front_matter_str}---\n{self.content}"
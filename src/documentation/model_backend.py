@@ -0,0 +1,213 @@
+import abc
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+
+class UsageMetadata:
+
+    def __init__(self, prompt_token_count=0, candidates_token_count=0, total_token_count=0):
+        """
+        Token usage reported with a streamed chunk, with the field names of the Gemini SDK.
+        """
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+        self.total_token_count = total_token_count
+
+
+class Chunk:
+
+    def __init__(self, text, usage_metadata=None):
+        """
+        A streamed response chunk, with the attributes read by generate_ai_content.
+        """
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+class BackendError(Exception):
+    """Raised by a backend when a request fails."""
+
+
+class RateLimitError(BackendError):
+    """Raised by FakeBackend when more requests than allowed are sent in a minute."""
+
+
+class ModelBackend(abc.ABC):
+
+    @abc.abstractmethod
+    def generate_content_stream(self, model, text, system_instruction):
+        """
+        Streams the model response to a text.
+        :param model: The model version.
+        :param text: The user input.
+        :param system_instruction: The system instruction.
+        :return: An iterator of chunks with 'text' and 'usage_metadata' attributes.
+        """
+
+
+class GeminiBackend(ModelBackend):
+
+    def __init__(self, api_key=None):
+        """
+        Backend calling the Gemini API.
+        :param api_key: The API key (default: GEMINI_API_KEY environment variable).
+        """
+        self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
+        self._client = None
+
+    def generate_content_stream(self, model, text, system_instruction):
+        # Imported here so that importing this module does not load the Gemini SDK.
+        from google import genai
+        from google.genai import types
+
+        if self._client is None:
+            self._client = genai.Client(api_key=self.api_key)
+        contents = [
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part.from_text(text=text),
+                ],
+            ),
+        ]
+        config = types.GenerateContentConfig(
+            response_mime_type="text/plain",
+            system_instruction=[
+                types.Part.from_text(text=system_instruction),
+            ],
+        )
+        return self._client.models.generate_content_stream(model=model, contents=contents, config=config)
+
+
+def recording_key(model, text, system_instruction):
+    """
+    :return: The key of a request in a recording file. The system instruction is part of it,
+             so a changed prompt is not answered with responses recorded for the old one.
+    """
+    return hashlib.sha256(f"{model}\0{system_instruction}\0{text}".encode("utf-8")).hexdigest()
+
+
+def load_recording(recording_path):
+    """
+    :return: Dictionary of request key to the list of recorded chunks, empty if the file does not exist.
+    """
+    try:
+        with open(recording_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+class RecordingBackend(ModelBackend):
+
+    def __init__(self, backend, recording_path):
+        """
+        Backend that forwards requests to another backend and records the streamed chunks,
+        so they can be replayed later by FakeBackend.
+        :param backend: The backend to record, usually GeminiBackend.
+        :param recording_path: JSON file the chunks are appended to.
+        """
+        self.backend = backend
+        self.recording_path = recording_path
+        self._lock = threading.Lock()
+
+    def generate_content_stream(self, model, text, system_instruction):
+        recorded = []
+        for chunk in self.backend.generate_content_stream(model, text, system_instruction):
+            usage = getattr(chunk, "usage_metadata", None)
+            recorded.append({
+                "text": chunk.text,
+                "usage_metadata": None if usage is None else {
+                    "prompt_token_count": usage.prompt_token_count or 0,
+                    "candidates_token_count": usage.candidates_token_count or 0,
+                    "total_token_count": usage.total_token_count or 0
+                }
+            })
+            yield chunk
+
+        with self._lock:
+            recording = load_recording(self.recording_path)
+            recording[recording_key(model, text, system_instruction)] = recorded
+            recording_dir = os.path.dirname(self.recording_path)
+            if recording_dir:
+                os.makedirs(recording_dir, exist_ok=True)
+            with open(self.recording_path, "w", encoding="utf-8") as file:
+                json.dump(recording, file, ensure_ascii=False, indent=2)
+
+
+class FakeBackend(ModelBackend):
+
+    def __init__(self, recording_path=None, first_chunk_latency=0.0, chunk_latency=0.0, chunk_size=80,
+                 requests_per_minute=None, error_rate=0.0, seed=None):
+        """
+        Offline backend for tests and benchmarks. It replays recorded chunks when the request
+        was recorded, and otherwise streams a canned response in the expected format with
+        token usage estimated from the text length.
+        :param recording_path: JSON file written by RecordingBackend (optional).
+        :param first_chunk_latency: Seconds to wait before the first chunk.
+        :param chunk_latency: Seconds to wait before each following chunk.
+        :param chunk_size: Number of characters per chunk of a canned response.
+        :param requests_per_minute: Requests allowed in any 60 second window; RateLimitError above it.
+        :param error_rate: Probability of failing a request with BackendError.
+        :param seed: Seed of the error injection.
+        """
+        self.recording = load_recording(recording_path) if recording_path else {}
+        self.first_chunk_latency = first_chunk_latency
+        self.chunk_latency = chunk_latency
+        self.chunk_size = chunk_size
+        self.requests_per_minute = requests_per_minute
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._request_times = []
+        self._lock = threading.Lock()
+        self.request_count = 0
+
+    def _admit_request(self):
+        with self._lock:
+            now = time.monotonic()
+            self.request_count += 1
+            if self.requests_per_minute is not None:
+                self._request_times = [moment for moment in self._request_times if now - moment < 60.0]
+                if len(self._request_times) >= self.requests_per_minute:
+                    raise RateLimitError(f"Rate limit of {self.requests_per_minute} requests per minute exceeded")
+                self._request_times.append(now)
+            if self.error_rate and self._random.random() < self.error_rate:
+                raise BackendError("Injected backend error")
+
+    def canned_chunks(self, text):
+        """
+        :return: The chunks of the canned response to a text, usage reported on the last chunk.
+        """
+        response = ("summaries\n\n"
+                    "pt-br: Resumo gerado localmente para testes.\n"
+                    "en: Summary generated locally for tests.\n\n"
+                    "descriptions\n\n"
+                    "pt-br: Descrição gerada localmente.\n"
+                    "en: Description generated locally.\n")
+        pieces = [response[start:start + self.chunk_size] for start in range(0, len(response), self.chunk_size)]
+        input_tokens = max(1, len(text) // 4)
+        output_tokens = max(1, len(response) // 4)
+        chunks = [Chunk(piece) for piece in pieces]
+        chunks[-1].usage_metadata = UsageMetadata(input_tokens, output_tokens, input_tokens + output_tokens)
+        return chunks
+
+    def generate_content_stream(self, model, text, system_instruction):
+        self._admit_request()
+        recorded = self.recording.get(recording_key(model, text, system_instruction))
+        if recorded is not None:
+            chunks = [Chunk(item["text"], UsageMetadata(**item["usage_metadata"]) if item["usage_metadata"] else None)
+                      for item in recorded]
+        else:
+            chunks = self.canned_chunks(text)
+        return self._stream(chunks)
+
+    def _stream(self, chunks):
+        for index, chunk in enumerate(chunks):
+            delay = self.first_chunk_latency if index == 0 else self.chunk_latency
+            if delay:
+                time.sleep(delay)
+            yield chunk
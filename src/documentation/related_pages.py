@@ -0,0 +1,181 @@
+import json
+import os
+import sys
+from collections import Counter
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+import yaml
+
+from src.documentation.front_matter import read_front_matter, split_front_matter_block, join_front_matter
+from src.documentation.search_index import SUPPORTED_LANGUAGES, tokenize, page_url
+from src.utils import atomic_write, text_sha256
+
+RELATED_VECTORS_FILE = os.path.join('.cache', 'related-vectors.json')
+DEFAULT_RELATED_COUNT = 5
+# Rows of the similarity matrix computed at once; memory grows with this times the number of pages.
+SIMILARITY_BLOCK_SIZE = 256
+
+
+def load_vector_cache(cache_path):
+    """
+    :return: Dictionary of text hash to term counts saved by a previous run.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_vector_cache(cache_path, vectors):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    atomic_write(cache_path, json.dumps(vectors, ensure_ascii=False, separators=(',', ':')))
+
+
+def term_counts(texts, language, cache):
+    """
+    Counts the terms of each text, reusing the counts cached by text hash.
+
+    :param texts: Texts to vectorize.
+    :param language: Language of the texts.
+    :param cache: Dictionary of text hash to term counts; new entries are added to it.
+    :return: List of term count dictionaries, one per text.
+    """
+    counts = []
+    for text in texts:
+        key = f"{language}:{text_sha256(text)}"
+        if key not in cache:
+            cache[key] = dict(Counter(tokenize(text, language)))
+        counts.append(cache[key])
+    return counts
+
+
+def tfidf_matrix(counts):
+    """
+    Builds the L2-normalized TF-IDF matrix of a corpus, sparse when SciPy is available.
+
+    :param counts: List of term count dictionaries, one per document.
+    :return: Matrix with one row per document.
+    """
+    vocabulary = {}
+    rows, columns, values = [], [], []
+    for row, document_counts in enumerate(counts):
+        for term, count in document_counts.items():
+            rows.append(row)
+            columns.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(1.0 + np.log(count))
+    rows = np.asarray(rows, dtype=np.int64)
+    columns = np.asarray(columns, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+
+    document_frequency = np.bincount(columns, minlength=len(vocabulary))
+    idf = np.log((1.0 + len(counts)) / (1.0 + document_frequency)) + 1.0
+    values = values * idf[columns]
+    norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=len(counts)))
+    values = values / np.where(norms > 0, norms, 1.0)[rows]
+
+    shape = (len(counts), len(vocabulary))
+    if sparse is not None:
+        return sparse.csr_matrix((values, (rows, columns)), shape=shape)
+    matrix = np.zeros(shape)
+    matrix[rows, columns] = values
+    return matrix
+
+
+def top_k_similar(matrix, k, block_size=SIMILARITY_BLOCK_SIZE):
+    """
+    Computes the k most similar documents of every document, one block of rows at a time,
+    so only a block_size x n slice of the similarity matrix is dense at any moment.
+
+    :param matrix: TF-IDF matrix as returned by tfidf_matrix.
+    :param k: Number of similar documents per document.
+    :param block_size: Number of documents whose similarities are computed at once.
+    :return: List with, for each document, the indexes of its most similar documents, best first.
+             Documents with no shared term are not included.
+    """
+    count = matrix.shape[0]
+    k = min(k, count - 1)
+    if k <= 0:
+        return [[] for _ in range(count)]
+
+    transposed = matrix.T
+    similar = []
+    for start in range(0, count, block_size):
+        end = min(start + block_size, count)
+        similarity = matrix[start:end] @ transposed
+        if sparse is not None and sparse.issparse(similarity):
+            similarity = similarity.toarray()
+        similarity = np.asarray(similarity, dtype=np.float64)
+        similarity[np.arange(end - start), np.arange(start, end)] = -1.0
+
+        candidates = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(similarity, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        ranked = np.take_along_axis(candidates, order, axis=1)
+        ranked_scores = np.take_along_axis(candidate_scores, order, axis=1)
+        similar.extend([int(index) for index, score in zip(row, scores) if score > 0]
+                       for row, scores in zip(ranked, ranked_scores))
+    return similar
+
+
+def update_related_pages(destination_repo_path, k=DEFAULT_RELATED_COUNT, languages=SUPPORTED_LANGUAGES):
+    """
+    Writes the 'related' front matter entry of the pages in the Hugo content tree with
+    the URLs of their k most similar pages of the same language. Every page is a candidate,
+    but only pages with a valid YAML front matter are rewritten: pages with TOML front
+    matter or none are left as they are. Pages whose related list did not change are not rewritten.
+
+    :param destination_repo_path: Path to the Hugo site repository.
+    :param k: Number of related pages per page.
+    :param languages: Languages to process.
+    :return: List of the pages rewritten.
+    """
+    cache_path = os.path.join(destination_repo_path, RELATED_VECTORS_FILE)
+    cache = load_vector_cache(cache_path)
+    used_keys = set()
+    updated = []
+
+    for language in languages:
+        content_language_path = os.path.join(destination_repo_path, 'content', language)
+        pages = []
+        for root, directories, files in os.walk(content_language_path):
+            directories.sort()
+            for file_name in sorted(files):
+                if file_name.endswith('.md'):
+                    page_path = os.path.join(root, file_name)
+                    with open(page_path, 'r', encoding='utf-8') as file:
+                        block, body = split_front_matter_block(file.read())
+                    front_matter = None
+                    if block is not None:
+                        try:
+                            front_matter = read_front_matter(page_path)
+                        except yaml.YAMLError as e:
+                            print(f"Invalid front matter in '{page_path}', leaving it unchanged: {e}",
+                                  file=sys.stderr)
+                        if not isinstance(front_matter, dict):
+                            front_matter = None
+                    pages.append((page_path, front_matter, body))
+        if not pages:
+            continue
+
+        texts = [f"{(front_matter or {}).get('title') or ''}\n{body}" for _, front_matter, body in pages]
+        used_keys.update(f"{language}:{text_sha256(text)}" for text in texts)
+        similar = top_k_similar(tfidf_matrix(term_counts(texts, language, cache)), k)
+        urls = [page_url(content_language_path, page_path, language) for page_path, _, _ in pages]
+
+        for (page_path, front_matter, body), indexes in zip(pages, similar):
+            related = [urls[index] for index in indexes]
+            if front_matter is None or front_matter.get('related', []) == related:
+                continue
+            front_matter['related'] = related
+            atomic_write(page_path, join_front_matter(front_matter, body))
+            updated.append(page_path)
+
+    save_vector_cache(cache_path, {key: value for key, value in cache.items() if key in used_keys})
+    return updated
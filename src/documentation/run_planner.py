@@ -0,0 +1,99 @@
+import math
+import os
+
+from src.documentation.generate_ai_content import SYSTEM_INSTRUCTION
+from src.documentation.sync import find_markdown_pages
+from src.documentation.token_cost import MODEL_PRICES, estimate_cost
+
+# Average characters per token of Gemini models on mixed pt-br/en Markdown.
+CHARACTERS_PER_TOKEN = 4
+# Summaries and descriptions in both languages; the logs show about 230 output tokens per document.
+ESTIMATED_OUTPUT_TOKENS = 250
+
+
+def estimate_tokens(text):
+    """
+    Estimates the number of tokens of a text without calling the model.
+    """
+    return math.ceil(len(text) / CHARACTERS_PER_TOKEN)
+
+
+def estimate_document_tokens(markdown_text):
+    """
+    Estimates the input and output tokens of a summarization request.
+
+    :param markdown_text: The Markdown text to summarize.
+    :return: Tuple (input_tokens, output_tokens).
+    """
+    return estimate_tokens(SYSTEM_INSTRUCTION) + estimate_tokens(markdown_text), ESTIMATED_OUTPUT_TOKENS
+
+
+def downgrade_models(model):
+    """
+    Lists the model and the cheaper models it may be downgraded to, most expensive first.
+
+    :param model: The preferred model.
+    :return: List of model names.
+    """
+    def reference_cost(name):
+        return estimate_cost(name, 1_000_000, 1_000_000)
+
+    cheaper = [name for name in MODEL_PRICES if name != model and reference_cost(name) < reference_cost(model)]
+    return [model] + sorted(cheaper, key=reference_cost, reverse=True)
+
+
+def plan_run(documents, budget, model="gemini-2.0-flash", allow_downgrade=True):
+    """
+    Plans a summarization run before any API call. Documents are taken in order of priority;
+    each gets the preferred model if it fits the remaining budget, otherwise the most
+    expensive cheaper model that fits. The run stops at the first document nothing fits.
+
+    :param documents: List of (path, markdown_text) tuples, highest priority first.
+    :param budget: Budget cap of the run in US$.
+    :param model: The preferred model.
+    :param allow_downgrade: If False, the run stops as soon as the preferred model does not fit.
+    :return: Dictionary with 'items' (path, model, input_tokens, output_tokens, cost),
+             'skipped' (paths left out), 'total_cost' and 'budget'.
+    """
+    models = downgrade_models(model) if allow_downgrade else [model]
+    items = []
+    total_cost = 0.0
+    for index, (path, markdown_text) in enumerate(documents):
+        input_tokens, output_tokens = estimate_document_tokens(markdown_text)
+        for candidate in models:
+            cost = estimate_cost(candidate, input_tokens, output_tokens)
+            if total_cost + cost <= budget:
+                break
+        else:
+            return {
+                "items": items,
+                "skipped": [skipped_path for skipped_path, _ in documents[index:]],
+                "total_cost": total_cost,
+                "budget": budget
+            }
+        items.append({
+            "path": path,
+            "model": candidate,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost": cost
+        })
+        total_cost += cost
+    return {"items": items, "skipped": [], "total_cost": total_cost, "budget": budget}
+
+
+def collect_documents(source_repo_path):
+    """
+    Reads the Markdown pages of the docs tree in order of priority: blog articles first,
+    then the most recently modified pages.
+
+    :param source_repo_path: Path to the source repository.
+    :return: List of (path, markdown_text) tuples.
+    """
+    pages = find_markdown_pages(source_repo_path)
+    pages.sort(key=lambda page: (os.sep + 'articles' + os.sep not in page, -os.path.getmtime(page)))
+    documents = []
+    for page in pages:
+        with open(page, 'r', encoding='utf-8') as file:
+            documents.append((page, file.read()))
+    return documents
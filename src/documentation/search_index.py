@@ -0,0 +1,217 @@
+import json
+import os
+import re
+import shutil
+import sys
+from collections import Counter, defaultdict
+
+import yaml
+
+from src.documentation.front_matter import read_front_matter, split_front_matter_block
+
+SUPPORTED_LANGUAGES = ('en', 'pt-br')
+SEARCH_INDEX_DIRECTORY = os.path.join('static', 'search')
+SHARD_PREFIX_LENGTH = 2
+
+STOP_WORDS = {
+    'en': {
+        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'in', 'is', 'it', 'its',
+        'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'were', 'will', 'with'
+    },
+    'pt-br': {
+        'a', 'ao', 'aos', 'as', 'com', 'da', 'das', 'de', 'do', 'dos', 'e', 'é', 'em', 'na', 'nas', 'no',
+        'nos', 'o', 'os', 'ou', 'para', 'pela', 'pelo', 'por', 'que', 'se', 'um', 'uma'
+    }
+}
+
+# Suffix rewrites of a light stemmer, checked in order; the first match wins.
+# English 'es' is only stripped after s/x/z/ch/sh, so 'templates' stems like 'template',
+# and a final 'ss' is kept, so 'class' stems like 'classes'.
+STEM_SUFFIXES = {
+    'en': [('ies', 'y'), ('sses', 'ss'), ('ss', 'ss'), ('ches', 'ch'), ('shes', 'sh'), ('xes', 'x'),
+           ('zes', 'z'), ('ing', ''), ('ed', ''), ('ly', ''), ('s', '')],
+    'pt-br': [('ções', 'ção'), ('ões', 'ão'), ('mente', ''), ('ais', 'al'), ('eis', 'el'), ('res', 'r'),
+              ('ns', 'm'), ('s', '')]
+}
+MIN_STEM_LENGTH = 4
+# English stems left with a doubled final consonant by these suffixes drop one letter ('running' -> 'run'),
+# except for the letters below ('falling' -> 'fall').
+UNDOUBLE_SUFFIXES = {'en': ('ing', 'ed'), 'pt-br': ()}
+UNDOUBLE_EXCEPTIONS = 'aeiouylsz'
+
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+MARKDOWN_NOISE_PATTERN = re.compile(r'```.*?```|`[^`]*`|<!--.*?-->|!\[[^\]]*\]\([^)]*\)|\]\([^)]*\)', re.DOTALL)
+
+
+def stem(word, language):
+    """
+    Reduces a word to its stem with a light suffix-stripping stemmer.
+
+    :param word: Lowercase word.
+    :param language: 'en' or 'pt-br'.
+    :return: The stem of the word.
+    """
+    for suffix, replacement in STEM_SUFFIXES[language]:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= MIN_STEM_LENGTH:
+            stemmed = word[:len(word) - len(suffix)] + replacement
+            if (suffix in UNDOUBLE_SUFFIXES[language] and stemmed[-1] == stemmed[-2]
+                    and stemmed[-1] not in UNDOUBLE_EXCEPTIONS):
+                stemmed = stemmed[:-1]
+            return stemmed
+    return word
+
+
+def tokenize(text, language):
+    """
+    Splits a Markdown text into stemmed search terms, dropping code, link targets and stop words.
+
+    :param text: Markdown text.
+    :param language: 'en' or 'pt-br'.
+    :return: List of terms in order of appearance.
+    """
+    text = MARKDOWN_NOISE_PATTERN.sub(' ', text).lower()
+    stop_words = STOP_WORDS[language]
+    return [stem(word, language) for word in WORD_PATTERN.findall(text)
+            if word not in stop_words and not word.isdigit() and len(word) > 1]
+
+
+def shard_name(term, prefix_length=SHARD_PREFIX_LENGTH):
+    """
+    :return: Name of the shard holding a term, built from its first characters.
+    """
+    return term[:prefix_length]
+
+
+def page_url(content_language_path, page_path, language):
+    """
+    Builds the Hugo URL of a page from its path in the content tree.
+
+    :param content_language_path: Path to the content directory of the language.
+    :param page_path: Path to the Markdown page.
+    :param language: Language of the page.
+    :return: URL of the page.
+    """
+    relative_path = os.path.splitext(os.path.relpath(page_path, content_language_path))[0]
+    parts = relative_path.split(os.sep)
+    if parts[-1] == '_index':
+        parts = parts[:-1]
+    return '/' + '/'.join([language] + parts) + '/'
+
+
+def read_pages(content_path, language):
+    """
+    Reads the pages of a language from the Hugo content tree, taking the front matter from
+    the parsed front matter cache. A page with invalid front matter is indexed by its body.
+
+    :param content_path: Path to the Hugo 'content' directory.
+    :param language: Language of the pages.
+    :return: List of dictionaries with 'url', 'title', 'summary' and 'text'.
+    """
+    content_language_path = os.path.join(content_path, language)
+    pages = []
+    for root, directories, files in os.walk(content_language_path):
+        directories.sort()
+        for file_name in sorted(files):
+            if not file_name.endswith('.md'):
+                continue
+            page_path = os.path.join(root, file_name)
+            with open(page_path, 'r', encoding='utf-8') as file:
+                _, body = split_front_matter_block(file.read())
+            try:
+                front_matter = read_front_matter(page_path)
+            except yaml.YAMLError as e:
+                print(f"Invalid front matter in '{page_path}', indexing its body only: {e}", file=sys.stderr)
+                front_matter = {}
+            if not isinstance(front_matter, dict):
+                front_matter = {}
+            pages.append({
+                'url': page_url(content_language_path, page_path, language),
+                'title': front_matter.get('title') or '',
+                'summary': front_matter.get('summary') or front_matter.get('description') or '',
+                'text': body
+            })
+    return pages
+
+
+def build_search_index(pages, language):
+    """
+    Builds an inverted index of term to postings, weighting title terms above body terms.
+
+    :param pages: Pages as returned by read_pages.
+    :param language: Language of the pages.
+    :return: Tuple (documents, postings) where documents is the list of page entries
+             and postings maps each term to a list of [document_id, weight] sorted by weight.
+    """
+    documents = []
+    postings = defaultdict(list)
+    for document_id, page in enumerate(pages):
+        documents.append({'url': page['url'], 'title': page['title'], 'summary': page['summary']})
+        weights = Counter(tokenize(page['text'], language))
+        for term in tokenize(f"{page['title']} {page['summary']}", language):
+            weights[term] += 5
+        for term, weight in weights.items():
+            postings[term].append([document_id, weight])
+    for term_postings in postings.values():
+        term_postings.sort(key=lambda posting: (-posting[1], posting[0]))
+    return documents, dict(postings)
+
+
+def write_json(file_path, data):
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+def write_search_index(output_path, language, documents, postings, prefix_length=SHARD_PREFIX_LENGTH):
+    """
+    Writes the index as a documents file, one shard per term prefix and a manifest,
+    so the browser only downloads the shards of the terms being searched.
+    The manifest carries the stemmer rules so queries are tokenized the same way.
+
+    :param output_path: Directory of the index of one language; it is replaced.
+    :param language: Language of the index.
+    :param documents: Page entries as returned by build_search_index.
+    :param postings: Postings as returned by build_search_index.
+    :param prefix_length: Number of leading term characters naming a shard.
+    :return: The manifest written.
+    """
+    shards = defaultdict(dict)
+    for term, term_postings in postings.items():
+        shards[shard_name(term, prefix_length)][term] = term_postings
+
+    if os.path.isdir(output_path):
+        shutil.rmtree(output_path)
+    os.makedirs(os.path.join(output_path, 'shards'))
+    write_json(os.path.join(output_path, 'documents.json'), documents)
+    for name, shard in shards.items():
+        write_json(os.path.join(output_path, 'shards', f"{name}.json"), shard)
+
+    manifest = {
+        'language': language,
+        'prefix_length': prefix_length,
+        'documents': len(documents),
+        'shards': sorted(shards),
+        'stop_words': sorted(STOP_WORDS[language]),
+        'stem_suffixes': [list(rule) for rule in STEM_SUFFIXES[language]],
+        'min_stem_length': MIN_STEM_LENGTH,
+        'undouble_suffixes': list(UNDOUBLE_SUFFIXES[language]),
+        'undouble_exceptions': UNDOUBLE_EXCEPTIONS
+    }
+    write_json(os.path.join(output_path, 'manifest.json'), manifest)
+    return manifest
+
+
+def build_search_indexes(destination_repo_path, languages=SUPPORTED_LANGUAGES):
+    """
+    Builds the search index of every language from the Hugo content tree into 'static/search'.
+
+    :param destination_repo_path: Path to the Hugo site repository.
+    :param languages: Languages to index.
+    :return: Dictionary of language to the manifest written.
+    """
+    content_path = os.path.join(destination_repo_path, 'content')
+    manifests = {}
+    for language in languages:
+        documents, postings = build_search_index(read_pages(content_path, language), language)
+        output_path = os.path.join(destination_repo_path, SEARCH_INDEX_DIRECTORY, language)
+        manifests[language] = write_search_index(output_path, language, documents, postings)
+    return manifests
@@ -0,0 +1,146 @@
+import json
+import os
+
+from src.documentation.asset_store import AssetStore
+from src.documentation.dependency_graph import DependencyGraph
+from src.documentation.journal import SyncJournal
+from src.documentation.file_handler import (
+    should_traverse_directory,
+    determine_file_actions,
+    build_destination_path,
+    optimize_images
+)
+from src.documentation.markdown import Markdown, extract_references, resolve_references
+from src.documentation.search_index import build_search_indexes
+from src.utils import atomic_write, file_sha256, text_sha256
+
+DEPENDENCY_GRAPH_FILE = os.path.join('.cache', 'dependencies.json')
+SYNC_JOURNAL_FILE = os.path.join('.cache', 'sync-journal.jsonl')
+
+
+def find_markdown_pages(source_repo_path):
+    """
+    Lists the Markdown pages under the 'docs' directory of the source repository.
+
+    :param source_repo_path: Path to the source repository.
+    :return: Sorted list of Markdown file paths.
+    """
+    pages = []
+    for root, directories, files in os.walk(os.path.join(source_repo_path, 'docs')):
+        directories[:] = [directory for directory in directories if should_traverse_directory(directory)]
+        for file_name in files:
+            file_path = os.path.join(root, file_name)
+            if 'handle_markdown' in determine_file_actions(file_path):
+                pages.append(file_path)
+    return sorted(pages)
+
+
+def sync_documentation(file_handler, max_workers=None):
+    """
+    Synchronizes the documentation of the source repository into the Hugo content tree.
+    Only pages whose content or referenced files changed are re-rendered, and only
+    the PNG files referenced by some page are copied. With use_asset_store, images are
+    written once to the content-addressed asset store and pages link to it. When any page
+    was rendered or removed, the related pages (if related_pages_count is set) and the
+    search index are rebuilt. Destination pages of deleted source pages are removed.
+
+    Completed pages and images are recorded in a journal and written atomically, so a run
+    interrupted midway resumes without redoing them and never leaves half-written files.
+
+    :param file_handler: FileHandler with the source and destination repositories.
+    :param max_workers: Number of worker processes used to optimize images.
+    :return: Dictionary with the destination paths of the rendered 'pages', copied 'assets'
+             and 'removed' pages.
+    """
+    graph = DependencyGraph(os.path.join(file_handler.destination_repo_path, DEPENDENCY_GRAPH_FILE))
+    graph.load()
+    journal = SyncJournal(os.path.join(file_handler.destination_repo_path, SYNC_JOURNAL_FILE))
+    journal.load()
+    resumed = bool(journal.items)
+
+    hashes = {}
+
+    def content_hash(file_path):
+        if file_path not in hashes:
+            hashes[file_path] = file_sha256(file_path)
+        return hashes[file_path]
+
+    asset_store = AssetStore(file_handler.destination_repo_path) if file_handler.use_asset_store else None
+    asset_urls = {}
+
+    pages = find_markdown_pages(file_handler.source_repo_path)
+    rendered_pages = []
+    referenced_assets = {}
+    for page in pages:
+        with open(page, 'r', encoding='utf-8') as file:
+            references = resolve_references(page, extract_references(file.read()))
+        dependency_hashes = {reference: content_hash(reference) for reference in references
+                             if os.path.isfile(reference)}
+        for reference, reference_hash in dependency_hashes.items():
+            if 'handle_png' not in determine_file_actions(reference):
+                continue
+            if asset_store is not None:
+                extension = os.path.splitext(reference)[1]
+                referenced_assets[reference] = asset_store.path_for(reference_hash, extension)
+                asset_urls[reference] = asset_store.url_for(reference_hash, extension)
+            else:
+                referenced_assets[reference] = build_destination_path(file_handler, reference)
+
+        page_hash = content_hash(page)
+        destination = build_destination_path(file_handler, page)
+        if not os.path.exists(destination) or graph.is_page_stale(page, page_hash, dependency_hashes):
+            work_hash = text_sha256(json.dumps([page_hash, dependency_hashes], sort_keys=True))
+            if journal.completed(page, work_hash, destination) is None:
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                markdown = Markdown(page, destination, file_handler.source_repo_path, file_handler, asset_urls)
+                markdown.merge_files()
+                atomic_write(destination, markdown.get_content())
+                journal.record(page, work_hash, destination)
+            graph.update_page(page, page_hash, dependency_hashes, destination)
+            rendered_pages.append(destination)
+    rendered_destinations = set(rendered_pages)
+    removed_pages = []
+    for destination in graph.remove_missing_pages(pages):
+        # A renamed source page may keep its destination, e.g. when only the letter case changed.
+        if destination not in rendered_destinations and os.path.exists(destination):
+            os.remove(destination)
+            removed_pages.append(destination)
+
+    # Keyed by destination so identical images stored by content hash are written once.
+    images_to_copy = {}
+    for source, destination in referenced_assets.items():
+        if destination in images_to_copy:
+            continue
+        stale = asset_store is None and graph.is_asset_stale(source, content_hash(source))
+        if journal.completed(source, content_hash(source), destination) is not None:
+            continue
+        if not os.path.exists(destination) or stale:
+            images_to_copy[destination] = source
+    for destination in images_to_copy:
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+    copied_assets = []
+    failed_destinations = set()
+    image_paths = [(source, destination) for destination, source in images_to_copy.items()]
+    for source, written in optimize_images(file_handler, image_paths, max_workers).items():
+        if written:
+            journal.record(source, content_hash(source), referenced_assets[source])
+            copied_assets.extend(written)
+        else:
+            failed_destinations.add(referenced_assets[source])
+    for source, destination in referenced_assets.items():
+        if destination not in failed_destinations:
+            graph.update_asset(source, content_hash(source))
+    graph.assets = {asset: asset_hash for asset, asset_hash in graph.assets.items() if asset in referenced_assets}
+    if asset_store is not None:
+        asset_store.remove_unreferenced({content_hash(source) for source in referenced_assets})
+
+    graph.save()
+    changed = bool(rendered_pages or removed_pages or resumed)
+    if changed and file_handler.related_pages_count:
+        # NumPy is only needed, and imported, when related pages are enabled.
+        from src.documentation.related_pages import update_related_pages
+        update_related_pages(file_handler.destination_repo_path, file_handler.related_pages_count)
+    if changed:
+        build_search_indexes(file_handler.destination_repo_path)
+    journal.clear()
+    return {'pages': rendered_pages, 'assets': copied_assets, 'removed': removed_pages}
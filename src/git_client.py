@@ -64,7 +64,8 @@ class GitClient:
         Retrieves the creation date and author of a file.
         :param file_path: The file for which to retrieve data.
         :param commit_id: The starting commit ID (default: first commit of the file using --reverse).
-        :return: A dictionary containing 'creation_date' and 'author'.
+        :return: A dictionary containing 'creation_date' (--date=iso format) and 'author', with empty
+                 values if the file was never committed, or None if git fails.
         """
         try:
             author_result = subprocess.run(
@@ -75,10 +76,201 @@ class GitClient:
                 ["git", "log", commit_id, "--format=%ad", "--date=iso", "--", file_path],
                 check=True, text=True, capture_output=True, cwd=self.repository_path
             )
+            # With --reverse the first line is the commit that added the file.
             return {
-                "author": author_result.stdout.strip(),
-                "creation_date": date_result.stdout.strip()
+                "author": next(iter(author_result.stdout.splitlines()), ""),
+                "creation_date": next(iter(date_result.stdout.splitlines()), "")
             }
         except subprocess.CalledProcessError as e:
             print(f"Failed to retrieve creation info for '{file_path}': {e}")
             return None
+
+
+class GitResult:
+
+    def __init__(self, args, returncode, stdout, stderr, timed_out=False):
+        """
+        Outcome of a git command run by AsyncGitClient.
+        :param args: The git arguments, without the 'git' executable.
+        :param returncode: Exit code of the process (None if it timed out or could not be started).
+        :param stderr: Standard error as text, or the error raised when the process could not be started.
+        :param stdout: Standard output as text.
+        :param timed_out: True if the command was killed after the timeout.
+        """
+        self.args = args
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.timed_out = timed_out
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.timed_out
+
+    def __repr__(self):
+        return (f"GitResult(args={self.args!r}, returncode={self.returncode!r}, "
+                f"timed_out={self.timed_out!r})")
+
+
+class GitCommandError(Exception):
+
+    def __init__(self, result):
+        """
+        Raised by AsyncGitClient when a git command fails or times out.
+        :param result: The GitResult of the failed command.
+        """
+        if result.timed_out:
+            reason = "timed out"
+        elif result.returncode is None:
+            reason = f"could not be started: {result.stderr.strip()}"
+        else:
+            reason = f"exited with {result.returncode}: {result.stderr.strip()}"
+        super().__init__(f"git {' '.join(result.args)} {reason}")
+        self.result = result
+
+
+class AsyncGitClient:
+
+    def __init__(self, repository_path=".", max_concurrency=8, timeout=30.0):
+        """
+        Initializes the asynchronous GitClient.
+        The client may be used by several event loops one after the other (e.g. successive
+        asyncio.run calls), but not by two loops at the same time. asyncio is imported on
+        first use, so importing this module for the blocking GitClient does not load it.
+        :param repository_path: Path to the git repository (default: current directory).
+        :param max_concurrency: Maximum number of git processes running at the same time.
+        :param timeout: Seconds after which a git process is killed (None for no limit).
+        """
+        self.repository_path = repository_path
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self):
+        """
+        Returns the semaphore of the running event loop, creating it on first use in that loop:
+        an asyncio.Semaphore is bound to the loop it first waits in.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(self, *args, timeout=None):
+        """
+        Runs a git command, waiting for a free slot when max_concurrency processes are running.
+        The git process is killed when the command times out or the calling task is cancelled.
+        :param args: The git arguments, without the 'git' executable.
+        :param timeout: Seconds for this command (default: the client timeout).
+        :return: A GitResult, also when git times out or cannot be started (e.g. a missing
+                 repository path or git executable); only cancellation is raised.
+        """
+        import asyncio
+
+        timeout = self.timeout if timeout is None else timeout
+        async with self._get_semaphore():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "git", *args, cwd=self.repository_path, stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+            except OSError as e:
+                return GitResult(list(args), None, "", str(e))
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                await self._kill(process)
+                return GitResult(list(args), None, "", "", timed_out=True)
+            except BaseException:
+                await self._kill(process)
+                raise
+        return GitResult(list(args), process.returncode, stdout.decode(errors='replace'),
+                         stderr.decode(errors='replace'))
+
+    @staticmethod
+    async def _kill(process):
+        """
+        Kills a git process that is still running and waits for it to exit.
+        """
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+
+    async def run_checked(self, *args, timeout=None):
+        """
+        Runs a git command and raises GitCommandError if it does not succeed.
+        :return: The successful GitResult.
+        """
+        result = await self.run(*args, timeout=timeout)
+        if not result.ok:
+            raise GitCommandError(result)
+        return result
+
+    async def commit(self, message):
+        """
+        Executes a git commit with the provided message.
+        :return: The GitResult of the command.
+        """
+        return await self.run("commit", "-m", message)
+
+    async def add(self, path):
+        """
+        Executes a git add for the specified path.
+        :return: The GitResult of the command.
+        """
+        return await self.run("add", path)
+
+    async def status(self):
+        """
+        Executes git status.
+        :return: The GitResult of the command; its stdout holds the status.
+        """
+        return await self.run("status")
+
+    async def file_change_since(self, commit_id_begin, commit_id_end="HEAD"):
+        """
+        Executes git diff to show file changes between two commits.
+        :return: The GitResult of the command; its stdout holds the diff.
+        """
+        return await self.run("diff", f"{commit_id_begin}..{commit_id_end}")
+
+    async def get_file_creation_info(self, file_path):
+        """
+        Retrieves the creation date and author of a file from its first commit, in one git call.
+        :param file_path: The file for which to retrieve data.
+        :return: A dictionary containing 'creation_date' and 'author'.
+        :raises GitCommandError: If git fails, times out, cannot be started or the file has no history.
+        """
+        result = await self.run_checked("log", "--reverse", "--format=%an%x00%ad", "--date=iso", "--", file_path)
+        first_line = result.stdout.split("\n", 1)[0]
+        if "\0" not in first_line:
+            raise GitCommandError(GitResult(result.args, 1, result.stdout, f"no history for '{file_path}'"))
+        author, creation_date = first_line.split("\0", 1)
+        return {
+            "author": author.strip(),
+            "creation_date": creation_date.strip()
+        }
+
+    async def get_files_creation_info(self, file_paths):
+        """
+        Retrieves the creation info of several files concurrently.
+        :param file_paths: The files for which to retrieve data.
+        :return: A dictionary of file path to its creation info dictionary, or to the GitCommandError raised.
+        """
+        import asyncio
+
+        results = await asyncio.gather(
+            *(self.get_file_creation_info(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, GitCommandError):
+                raise result
+        return dict(zip(file_paths, results))
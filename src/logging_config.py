@@ -0,0 +1,137 @@
+import atexit
+import gzip
+import logging
+import os
+import queue
+import re
+import shutil
+import time
+from logging.handlers import BaseRotatingHandler, QueueHandler, QueueListener
+from pathlib import Path
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_listener = None
+
+
+class MonthlyRotatingFileHandler(BaseRotatingHandler):
+
+    def __init__(self, filename, backup_count=12, compress=False, utc=True, encoding='utf-8'):
+        """
+        File handler that starts a new file at the first record of each calendar month.
+        The finished month is moved to '<filename>.<YYYY-MM>' (gzip compressed with '.gz' when
+        compress is set). If that file already exists the month is appended to it.
+
+        :param filename: Path of the current log file.
+        :param backup_count: Number of monthly files to keep (0 keeps all).
+        :param compress: If True, finished months are gzip compressed.
+        :param utc: If True, months are computed in UTC.
+        :param encoding: Encoding of the log file.
+        """
+        super().__init__(filename, 'a', encoding=encoding)
+        self.backup_count = backup_count
+        self.compress = compress
+        self.utc = utc
+        if compress:
+            self.namer = lambda name: f"{name}.gz"
+            self.rotator = _gzip_append
+        else:
+            self.rotator = _append
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            self.month = self.month_of(os.path.getmtime(self.baseFilename))
+        else:
+            self.month = self.month_of(time.time())
+
+    def month_of(self, timestamp):
+        return time.strftime('%Y-%m', time.gmtime(timestamp) if self.utc else time.localtime(timestamp))
+
+    def shouldRollover(self, record):
+        return self.month_of(record.created) != self.month
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            self.rotate(self.baseFilename, self.rotation_filename(f"{self.baseFilename}.{self.month}"))
+        self.month = self.month_of(time.time())
+        self.delete_old_files()
+        self.stream = self._open()
+
+    def delete_old_files(self):
+        """
+        Removes the oldest monthly files beyond backup_count.
+        """
+        if self.backup_count <= 0:
+            return
+        directory, base_name = os.path.split(self.baseFilename)
+        pattern = re.compile(rf"^{re.escape(base_name)}\.\d{{4}}-\d{{2}}(\.gz)?$")
+        monthly_files = sorted(name for name in os.listdir(directory) if pattern.match(name))
+        for name in monthly_files[:-self.backup_count]:
+            os.remove(os.path.join(directory, name))
+
+
+def _append(source, destination):
+    with open(source, 'rb') as source_file, open(destination, 'ab') as destination_file:
+        shutil.copyfileobj(source_file, destination_file)
+    os.remove(source)
+
+
+def _gzip_append(source, destination):
+    # Appending writes a new gzip member; gzip readers return all members as one stream.
+    with open(source, 'rb') as source_file, gzip.open(destination, 'ab') as destination_file:
+        shutil.copyfileobj(source_file, destination_file)
+    os.remove(source)
+
+
+def setup_logging(log_file_base_path, compress=False, backup_count=12, level=logging.INFO):
+    """
+    Configures the root logger to write to a monthly rotating file through a queue.
+    Records are only enqueued on the calling thread; a listener thread formats and writes them.
+    Subsequent calls do nothing.
+
+    :param log_file_base_path: Path of the current log file.
+    :param compress: If True, finished months are gzip compressed.
+    :param backup_count: Number of monthly files to keep.
+    :param level: Level of the root logger.
+    :return: The QueueListener writing the records.
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    log_dir = os.path.dirname(log_file_base_path)
+    if log_dir:
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+    file_handler = MonthlyRotatingFileHandler(log_file_base_path, backup_count=backup_count, compress=compress)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger()
+    logger.setLevel(level)
+    logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """
+    Flushes the queued records, stops the listener thread and closes the log file.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        handler.close()
@@ -0,0 +1,185 @@
+import json
+import os
+import re
+import sys
+
+from src.publish.static_assets import FINGERPRINTED_PATTERN
+from src.utils import atomic_copy, atomic_write, file_sha256, text_sha256
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    font_subset = None
+    TTFont = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FONT_DIRECTORY = 'webfonts'
+FONT_EXTENSIONS = {'.ttf', '.woff2'}
+FONT_CACHE_DIRECTORY = os.path.join('.cache', 'font-subsets')
+STATE_FILE = os.path.join('.cache', 'font-subsets.json')
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_RULE_PATTERN = re.compile(r'([^{}]+)\{([^{}]*)\}')
+# Font Awesome 6 declares each icon as '.fa-<name>::before { content: "\f0c9"; }' (or with the '--fa' property).
+ICON_CONTENT_PATTERN = re.compile(r'(?:content|--fa)\s*:\s*["\']\\([0-9a-fA-F]{1,6})["\']')
+ICON_SELECTOR_PATTERN = re.compile(r'^\.(fa-[a-z0-9-]+)(?:::?before)?$')
+ICON_CLASS_PATTERN = re.compile(r'(?<![\w-])fa-[a-z0-9-]+')
+
+
+def read_icon_map(css_texts):
+    """
+    Maps the Font Awesome icon classes of the stylesheets to their codepoints.
+    Rules of other selectors that display a glyph (e.g. a search icon drawn with ':before')
+    are always kept, since their glyph does not depend on a class in the pages.
+
+    :param css_texts: Contents of the stylesheets.
+    :return: Tuple (icon_map, css_codepoints) with a dictionary of class to set of codepoints
+             and the set of codepoints displayed by the other rules.
+    """
+    icon_map = {}
+    css_codepoints = set()
+    for css in css_texts:
+        for selectors, declarations in CSS_RULE_PATTERN.findall(CSS_COMMENT_PATTERN.sub('', css)):
+            codepoints = {int(value, 16) for value in ICON_CONTENT_PATTERN.findall(declarations)}
+            if not codepoints:
+                continue
+            for selector in selectors.split(','):
+                selector = selector.strip()
+                icon = ICON_SELECTOR_PATTERN.match(selector)
+                if icon:
+                    icon_map.setdefault(icon.group(1), set()).update(codepoints)
+                elif selector:
+                    css_codepoints.update(codepoints)
+    return icon_map, css_codepoints
+
+
+def find_used_icons(public_path):
+    """
+    Scans the generated pages and scripts of the Hugo 'public' tree for 'fa-*' classes, and
+    its stylesheets for the icon codepoints. Scripts are scanned as well since some theme
+    scripts add icons at runtime (e.g. the copy button of the code blocks).
+
+    :param public_path: Path to the Hugo 'public' directory.
+    :return: Tuple (icons, codepoints) with the sorted list of used icon classes and the
+             sorted list of codepoints to keep in the fonts.
+    """
+    css_texts = []
+    used_classes = set()
+    for root, _, file_names in os.walk(public_path):
+        for file_name in file_names:
+            extension = os.path.splitext(file_name)[1]
+            if extension not in ('.html', '.js', '.css') or FINGERPRINTED_PATTERN.search(file_name):
+                continue
+            with open(os.path.join(root, file_name), 'r', encoding='utf-8', errors='replace') as file:
+                text = file.read()
+            if extension == '.css':
+                css_texts.append(text)
+            else:
+                used_classes.update(ICON_CLASS_PATTERN.findall(text))
+
+    icon_map, codepoints = read_icon_map(css_texts)
+    icons = sorted(used_classes & icon_map.keys())
+    for icon in icons:
+        codepoints |= icon_map[icon]
+    return icons, sorted(codepoints)
+
+
+def subset_font(source_path, destination_path, codepoints):
+    """
+    Writes a copy of a font keeping only the glyphs of the codepoints, in the format of the destination.
+
+    :param source_path: Path to the full font.
+    :param destination_path: Path to the subset font ('.ttf' or '.woff2').
+    :param codepoints: List of codepoints to keep.
+    """
+    options = font_subset.Options()
+    options.layout_features = ['*']
+    options.ignore_missing_unicodes = True
+    font = TTFont(source_path)
+    subsetter = font_subset.Subsetter(options=options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    font.flavor = 'woff2' if destination_path.endswith('.woff2') else None
+    font.save(destination_path)
+    font.close()
+
+
+def subset_icon_fonts(public_path):
+    """
+    Post-build stage that subsets the Font Awesome fonts of the Hugo 'public' tree to the
+    icons the site uses. It must run before the static assets stage, so the fingerprints
+    and precompressed files are computed from the subset fonts.
+
+    The full fonts are kept in the cache, so a later build that finds a subset written by a
+    previous run (Hugo does not clean 'public') still subsets from the full font. Subsets are
+    cached by font and used-icon set; a build using the same icons only copies them.
+    Without the optional fontTools package the fonts are left unchanged.
+
+    :param public_path: Path to the Hugo 'public' directory.
+    :return: Dictionary with the used 'icons', the number of 'codepoints' kept and, for each
+             font, its size before and after as a (full_size, subset_size) tuple in 'fonts'.
+    """
+    icons, codepoints = find_used_icons(public_path)
+    result = {'icons': icons, 'codepoints': len(codepoints), 'fonts': {}}
+    if font_subset is None:
+        print("fontTools is not installed; icon fonts were not subset.", file=sys.stderr)
+        return result
+
+    font_path = os.path.join(public_path, FONT_DIRECTORY)
+    if not os.path.isdir(font_path):
+        return result
+    site_path = os.path.dirname(os.path.abspath(public_path))
+    cache_path = os.path.join(site_path, FONT_CACHE_DIRECTORY)
+    state_path = os.path.join(site_path, STATE_FILE)
+    try:
+        with open(state_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        state = {}
+
+    icon_set_key = text_sha256(json.dumps(codepoints))[:16]
+    for file_name in sorted(os.listdir(font_path)):
+        extension = os.path.splitext(file_name)[1]
+        if extension not in FONT_EXTENSIONS or FINGERPRINTED_PATTERN.search(file_name):
+            continue
+        if extension == '.woff2' and brotli is None:
+            print(f"brotli is not installed; {file_name} was not subset.", file=sys.stderr)
+            continue
+        file_path = os.path.join(font_path, file_name)
+        file_hash = file_sha256(file_path)
+        entry = state.get(file_name)
+        if entry and entry['subset'] == file_hash:
+            original_hash = entry['original']
+        else:
+            original_hash = file_hash
+        original_path = os.path.join(cache_path, 'originals', f"{original_hash}{extension}")
+        if not os.path.exists(original_path):
+            if original_hash != file_hash:
+                print(f"Full font of {file_name} is missing from the cache; skipping it.", file=sys.stderr)
+                continue
+            os.makedirs(os.path.dirname(original_path), exist_ok=True)
+            atomic_copy(file_path, original_path)
+
+        subset_path = os.path.join(cache_path, icon_set_key, f"{original_hash}{extension}")
+        if not os.path.exists(subset_path):
+            os.makedirs(os.path.dirname(subset_path), exist_ok=True)
+            try:
+                subset_font(original_path, f"{subset_path}.tmp{extension}", codepoints)
+            except Exception as e:
+                print(f"Error subsetting {file_name}: {e}", file=sys.stderr)
+                continue
+            os.replace(f"{subset_path}.tmp{extension}", subset_path)
+
+        subset_hash = file_sha256(subset_path)
+        if subset_hash != file_hash:
+            atomic_copy(subset_path, file_path)
+        state[file_name] = {'original': original_hash, 'subset': subset_hash}
+        result['fonts'][file_name] = (os.path.getsize(original_path), os.path.getsize(subset_path))
+
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    atomic_write(state_path, json.dumps(state, indent=2, sort_keys=True))
+    return result
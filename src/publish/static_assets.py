@@ -0,0 +1,199 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utils import atomic_write, file_sha256
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Directories of the Hugo 'public' tree whose files get a content-hash fingerprint.
+# Fonts come first so the stylesheets referencing them can be rewritten before being hashed.
+FINGERPRINT_DIRECTORIES = ('webfonts', 'css', 'scss', 'js')
+FINGERPRINT_EXTENSIONS = {'.css', '.js', '.ttf', '.woff', '.woff2'}
+COMPRESSIBLE_EXTENSIONS = {'.html', '.css', '.js', '.json', '.xml', '.svg', '.txt', '.map', '.ttf', '.ico'}
+FINGERPRINT_LENGTH = 10
+FINGERPRINTED_PATTERN = re.compile(rf"\.[0-9a-f]{{{FINGERPRINT_LENGTH}}}\.[^./]+$")
+MANIFEST_FILE = 'assets-manifest.json'
+STATE_FILE = os.path.join('.cache', 'static-assets.json')
+CSS_URL_PATTERN = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+HTML_REFERENCE_PATTERN = re.compile(r'((?:src|href)=["\'])/([^"\'?#]+)')
+
+
+def fingerprinted_name(relative_path, content_hash):
+    """
+    :return: The path with the first characters of the content hash before the extension.
+    """
+    base, extension = os.path.splitext(relative_path)
+    return f"{base}.{content_hash[:FINGERPRINT_LENGTH]}{extension}"
+
+
+def rewrite_css_urls(css, css_relative_path, manifest):
+    """
+    Points the relative url() references of a stylesheet to the fingerprinted files.
+
+    :param css: Content of the stylesheet.
+    :param css_relative_path: Path of the stylesheet inside 'public', with '/' separators.
+    :param manifest: Dictionary of original to fingerprinted path inside 'public'.
+    :return: The rewritten stylesheet.
+    """
+    css_dir = os.path.dirname(css_relative_path)
+
+    def replace(match):
+        quote, url = match.groups()
+        if url.startswith(('data:', 'http:', 'https:', '/')):
+            return match.group(0)
+        path = re.split(r'[?#]', url, maxsplit=1)[0]
+        target = os.path.normpath(os.path.join(css_dir, path)).replace(os.sep, '/')
+        if target not in manifest:
+            return match.group(0)
+        relative = os.path.relpath(manifest[target], css_dir or '.').replace(os.sep, '/')
+        return f"url({quote}{relative}{url[len(path):]}{quote})"
+
+    return CSS_URL_PATTERN.sub(replace, css)
+
+
+def rewrite_html_references(html, manifest):
+    """
+    Points the root-relative src and href attributes of a page to the fingerprinted files.
+    """
+    def replace(match):
+        prefix, path = match.groups()
+        return f"{prefix}/{manifest.get(path, path)}"
+
+    return HTML_REFERENCE_PATTERN.sub(replace, html)
+
+
+def fingerprint_assets(public_path):
+    """
+    Writes a fingerprinted copy of each asset and removes the copies of previous contents.
+
+    :param public_path: Path to the Hugo 'public' directory.
+    :return: Manifest of original to fingerprinted path, with '/' separators.
+    """
+    manifest = {}
+    for directory in FINGERPRINT_DIRECTORIES:
+        directory_path = os.path.join(public_path, directory)
+        if not os.path.isdir(directory_path):
+            continue
+        for file_name in sorted(os.listdir(directory_path)):
+            extension = os.path.splitext(file_name)[1]
+            if extension not in FINGERPRINT_EXTENSIONS or FINGERPRINTED_PATTERN.search(file_name):
+                continue
+            relative_path = f"{directory}/{file_name}"
+            file_path = os.path.join(directory_path, file_name)
+            if extension == '.css':
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    content = rewrite_css_urls(file.read(), relative_path, manifest).encode('utf-8')
+            else:
+                with open(file_path, 'rb') as file:
+                    content = file.read()
+            fingerprinted = fingerprinted_name(relative_path, hashlib.sha256(content).hexdigest())
+            fingerprinted_path = os.path.join(public_path, fingerprinted)
+            if not os.path.exists(fingerprinted_path):
+                atomic_write(fingerprinted_path, content)
+            manifest[relative_path] = fingerprinted
+
+    current = {os.path.normpath(os.path.join(public_path, path)) for path in manifest.values()}
+    for directory in FINGERPRINT_DIRECTORIES:
+        directory_path = os.path.join(public_path, directory)
+        if not os.path.isdir(directory_path):
+            continue
+        for file_name in os.listdir(directory_path):
+            base_name = re.sub(r'\.(gz|br)$', '', file_name)
+            file_path = os.path.normpath(os.path.join(directory_path, base_name))
+            if FINGERPRINTED_PATTERN.search(base_name) and file_path not in current:
+                os.remove(os.path.join(directory_path, file_name))
+    return manifest
+
+
+def compress_file(file_path):
+    """
+    Writes the .gz sibling of a file, and the .br sibling when brotli is installed.
+    A sibling that would not be smaller than the file is removed instead.
+
+    :param file_path: Path to the file.
+    :return: List of the compressed files written.
+    """
+    with open(file_path, 'rb') as file:
+        content = file.read()
+    encoders = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append(('.br', lambda data: brotli.compress(data, quality=11)))
+
+    written = []
+    for suffix, encode in encoders:
+        compressed = encode(content)
+        compressed_path = f"{file_path}{suffix}"
+        if len(compressed) < len(content):
+            atomic_write(compressed_path, compressed)
+            written.append(compressed_path)
+        elif os.path.exists(compressed_path):
+            os.remove(compressed_path)
+    return written
+
+
+def process_static_assets(public_path, max_workers=None):
+    """
+    Post-build stage of the Hugo 'public' tree: fingerprints the assets, writes the manifest,
+    points the pages to the fingerprinted files and writes precompressed siblings in a
+    process pool. Files whose content hash did not change since the last run and whose
+    compressed siblings are still present are not compressed again.
+
+    :param public_path: Path to the Hugo 'public' directory.
+    :param max_workers: Number of compression processes.
+    :return: Dictionary with the 'manifest' and the list of 'compressed' files written.
+    """
+    manifest = fingerprint_assets(public_path)
+    atomic_write(os.path.join(public_path, MANIFEST_FILE), json.dumps(manifest, indent=2, sort_keys=True))
+
+    state_path = os.path.join(os.path.dirname(os.path.abspath(public_path)), STATE_FILE)
+    try:
+        with open(state_path, 'r', encoding='utf-8') as file:
+            previous_state = json.load(file)
+    except (OSError, ValueError):
+        previous_state = {}
+
+    state = {}
+    to_compress = []
+    for root, _, file_names in os.walk(public_path):
+        for file_name in file_names:
+            file_path = os.path.join(root, file_name)
+            extension = os.path.splitext(file_name)[1]
+            if extension == '.html':
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    html = file.read()
+                rewritten = rewrite_html_references(html, manifest)
+                if rewritten != html:
+                    atomic_write(file_path, rewritten)
+            if extension not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            relative_path = os.path.relpath(file_path, public_path).replace(os.sep, '/')
+            file_hash = file_sha256(file_path)
+            previous = previous_state.get(relative_path)
+            if (isinstance(previous, dict) and previous['hash'] == file_hash
+                    and all(os.path.exists(f"{file_path}{suffix}") for suffix in previous['compressed'])):
+                state[relative_path] = previous
+            else:
+                state[relative_path] = {'hash': file_hash, 'compressed': []}
+                to_compress.append((relative_path, file_path))
+
+    compressed = []
+    file_paths = [file_path for _, file_path in to_compress]
+    if len(to_compress) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(compress_file, file_paths, chunksize=8))
+    else:
+        results = [compress_file(file_path) for file_path in file_paths]
+    for (relative_path, file_path), written in zip(to_compress, results):
+        state[relative_path]['compressed'] = [path[len(file_path):] for path in written]
+        compressed.extend(written)
+
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    atomic_write(state_path, json.dumps(state, indent=2, sort_keys=True))
+    return {'manifest': manifest, 'compressed': compressed}
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+from src import logging_config
+from src.cli import PROJECT_ROOT, build_parser, main
+
+
+def test_cli_import_does_not_load_heavy_modules():
+    """Tests if importing the CLI loads neither the Gemini SDK nor the sync pipeline."""
+    code = ("import sys, src.cli; "
+            "print([m for m in ('google.genai', 'yaml', 'src.documentation.sync') if m in sys.modules])")
+    result = subprocess.run([sys.executable, '-c', code], check=True, text=True, capture_output=True,
+                            cwd=PROJECT_ROOT)
+    assert result.stdout.strip() == '[]'
+
+
+def test_parse_sync_arguments():
+    """Tests if the sync options are parsed."""
+    args = build_parser().parse_args(['sync', 'source', 'destination', '--image-width', '480',
+                                      '--image-width', '960', '--webp'])
+    assert args.source_repo_path == 'source'
+    assert args.destination_repo_path == 'destination'
+    assert args.image_widths == [480, 960]
+    assert args.webp is True
+
+
+def test_cost_command(tmp_path, capsys):
+    """Tests if the cost subcommand reports the tokens found in the logs."""
+    log_file = tmp_path / 'ai_token_accounting.log'
+    log_file.write_text("2025-04-11 00:15:53,510 - INFO - Completed generate_summary for 'Doc' with model "
+                        "'gemini-2.0-flash' - Input tokens: 1000 Output tokens: 200 Total tokens: 1200\n",
+                        encoding='utf-8')
+    assert main(['cost', str(tmp_path)]) == 0
+    assert 'Total tokens across all files: 1,200' in capsys.readouterr().out
+
+
+def test_summarize_compress_logs_without_log_file(tmp_path, monkeypatch, capsys):
+    """Tests if --compress-logs applies to the default log file when --log-file is not given."""
+    monkeypatch.setenv('LOG_FILE_PATH', str(tmp_path / 'summary.log'))
+    page = tmp_path / 'page.md'
+    page.write_text('# Title\n\nBody text', encoding='utf-8')
+    try:
+        assert main(['summarize', str(page), '--fake', '--compress-logs']) == 0
+        handler = logging_config._listener.handlers[0]
+        assert handler.baseFilename == str(tmp_path / 'summary.log')
+        assert handler.compress is True
+    finally:
+        logging_config.stop_logging()
+    assert 'Summaries:' in capsys.readouterr().out
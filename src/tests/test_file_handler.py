@@ -5,9 +5,13 @@ from src.documentation.file_handler import (
     FileHandler,
     should_traverse_directory,
     determine_file_actions,
-    build_destination_path
+    build_destination_path,
+    image_variant_paths,
+    optimize_image,
+    optimize_images
 )
-from src.utils import camel_to_kebab
+from src.documentation import file_handler as file_handler_module
+from src.utils import camel_to_kebab, file_sha256
 
 
 # Fixture para os caminhos temporários (usada nos testes de build_destination_path)
@@ -171,4 +175,142 @@ def test_build_destination_path_images_file(file_handler, temp_repos):
     image_filename = camel_to_kebab(image_file)
     expectation = dest_repo / 'content' / language / 'docs' / 'my-source-repository' / 'images' / image_filename
     result = build_destination_path(file_handler, str(source_path))
-    assert os.path.normpath(result) == os.path.normpath(expectation)
\ No newline at end of file
+    assert os.path.normpath(result) == os.path.normpath(expectation)
+
+
+# Testes do pipeline de imagens
+def test_image_variant_paths():
+    """Tests if the variant names map to the expected destination paths."""
+    variants = image_variant_paths('/site/images/diagram.png', widths=(480,), emit_webp=True)
+    assert variants == {
+        'optimized.png': '/site/images/diagram.png',
+        'optimized.webp': '/site/images/diagram.webp',
+        '480w.png': '/site/images/diagram-480w.png',
+        '480w.webp': '/site/images/diagram-480w.webp'
+    }
+
+
+def test_optimize_image_without_pillow_copies_file(tmp_path, monkeypatch):
+    """Tests if the PNG is copied byte-for-byte when Pillow is not available."""
+    monkeypatch.setattr(file_handler_module, 'Image', None)
+    source = tmp_path / 'diagram.png'
+    source.write_bytes(b'png-bytes')
+    destination = tmp_path / 'out.png'
+    assert optimize_image(str(source), str(destination), str(tmp_path / 'cache')) == [str(destination)]
+    assert destination.read_bytes() == b'png-bytes'
+
+
+def test_optimize_image_reuses_cache(tmp_path, monkeypatch):
+    """Tests if cached variants are copied without processing the image again."""
+    monkeypatch.setattr(file_handler_module, 'Image', object())
+    monkeypatch.setattr(file_handler_module, 'render_image_variants',
+                        lambda *args: pytest.fail('cached image should not be processed'))
+    source = tmp_path / 'diagram.png'
+    source.write_bytes(b'png-bytes')
+    cache_entry = tmp_path / 'cache' / file_sha256(source)
+    cache_entry.mkdir(parents=True)
+    (cache_entry / 'optimized.png').write_bytes(b'optimized')
+    (cache_entry / '480w.png').write_bytes(b'small')
+
+    written = optimize_image(str(source), str(tmp_path / 'out.png'), str(tmp_path / 'cache'), widths=(480,))
+    assert written == [str(tmp_path / 'out.png'), str(tmp_path / 'out-480w.png')]
+    assert (tmp_path / 'out.png').read_bytes() == b'optimized'
+    assert (tmp_path / 'out-480w.png').read_bytes() == b'small'
+
+
+def test_optimize_image_with_pillow(tmp_path):
+    """Tests if a real PNG is optimized into a complete cache entry and its variants are written."""
+    image_module = pytest.importorskip('PIL.Image')
+    source = tmp_path / 'diagram.png'
+    image_module.new('RGB', (64, 32), (255, 0, 0)).save(source, format='PNG')
+    cache = tmp_path / 'cache'
+    destination = tmp_path / 'out.png'
+
+    written = optimize_image(str(source), str(destination), str(cache), widths=(16,), emit_webp=True)
+
+    assert written == [str(destination), str(tmp_path / 'out.webp'), str(tmp_path / 'out-16w.png'),
+                       str(tmp_path / 'out-16w.webp')]
+    assert sorted(os.listdir(cache)) == [file_sha256(source)]
+    assert sorted(os.listdir(cache / file_sha256(source))) == ['16w.png', '16w.webp', 'optimized.png',
+                                                                'optimized.webp']
+    with image_module.open(destination) as optimized:
+        assert optimized.size == (64, 32)
+    with image_module.open(tmp_path / 'out-16w.png') as resized:
+        assert resized.size == (16, 8)
+
+
+def test_render_image_variants_interrupted_leaves_no_entry(tmp_path, monkeypatch):
+    """Tests if an interrupted render leaves neither a partial cache entry nor a temporary directory."""
+    image_module = pytest.importorskip('PIL.Image')
+    source = tmp_path / 'diagram.png'
+    image_module.new('RGB', (64, 32), (255, 0, 0)).save(source, format='PNG')
+    cache = tmp_path / 'cache'
+
+    def interrupted_resize(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(image_module.Image, 'resize', interrupted_resize)
+    with pytest.raises(KeyboardInterrupt):
+        file_handler_module.render_image_variants(str(source), str(cache / 'entry'), widths=(16,))
+    assert os.listdir(cache) == []
+
+
+def test_optimize_images_renders_identical_sources_once(tmp_path, monkeypatch):
+    """Tests if sources with identical bytes are rendered once and written to every destination."""
+    monkeypatch.setattr(file_handler_module, 'Image', object())
+    rendered = []
+
+    def fake_render(source_file_path, cache_entry_path, widths=(), emit_webp=False):
+        rendered.append(source_file_path)
+        os.makedirs(cache_entry_path)
+        Path(cache_entry_path, 'optimized.png').write_bytes(b'optimized')
+
+    monkeypatch.setattr(file_handler_module, 'render_image_variants', fake_render)
+    sources = [tmp_path / 'en' / 'diagram.png', tmp_path / 'pt-br' / 'diagram.png']
+    for source in sources:
+        source.parent.mkdir()
+        source.write_bytes(b'png-bytes')
+    handler = FileHandler(str(tmp_path), str(tmp_path / 'site'))
+    image_paths = [(str(source), str(tmp_path / 'site' / f"{source.parent.name}.png")) for source in sources]
+
+    written = optimize_images(handler, image_paths)
+
+    assert rendered == [str(sources[0])]
+    assert written == {source: [destination] for source, destination in image_paths}
+    for _, destination in image_paths:
+        assert Path(destination).read_bytes() == b'optimized'
+
+
+def test_optimize_images_identical_sources_in_pool(tmp_path):
+    """Tests if identical images optimized by several workers are all published from one cache entry."""
+    image_module = pytest.importorskip('PIL.Image')
+    image_paths = []
+    for index in range(4):
+        source = tmp_path / 'source' / f"diagram-{index}.png"
+        source.parent.mkdir(exist_ok=True)
+        image_module.new('RGB', (80, 60), (0, 0, 255)).save(source, format='PNG')
+        image_paths.append((str(source), str(tmp_path / 'site' / f"diagram-{index}.png")))
+    os.makedirs(tmp_path / 'site')
+    handler = FileHandler(str(tmp_path), str(tmp_path / 'site'), image_widths=(20, 40), emit_webp=True)
+
+    written = optimize_images(handler, image_paths, max_workers=4)
+
+    for source, destination in image_paths:
+        assert written[source][0] == destination
+        assert all(os.path.exists(path) for path in written[source])
+    assert len(os.listdir(handler.image_cache_path)) == 1
+
+
+def test_render_image_variants_keeps_existing_entry(tmp_path):
+    """Tests if new variants are added next to an existing cache entry instead of replacing it."""
+    image_module = pytest.importorskip('PIL.Image')
+    source = tmp_path / 'diagram.png'
+    image_module.new('RGB', (64, 32), (255, 0, 0)).save(source, format='PNG')
+    entry = tmp_path / 'cache' / 'entry'
+    entry.mkdir(parents=True)
+    (entry / 'optimized.png').write_bytes(b'in use')
+
+    file_handler_module.render_image_variants(str(source), str(entry), widths=(16,))
+
+    assert sorted(os.listdir(entry)) == ['16w.png', 'optimized.png']
+    assert sorted(os.listdir(tmp_path / 'cache')) == ['entry']
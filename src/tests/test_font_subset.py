@@ -0,0 +1,99 @@
+import pytest
+
+from src.publish import font_subset
+from src.publish.font_subset import find_used_icons, read_icon_map, subset_icon_fonts
+
+ICON_CSS = """/*! Font Awesome */
+.fa-bars::before {
+  content: "\\f0c9"; }
+.fa-copy::before {
+  content: "\\f0c5"; }
+.fa-github::before {
+  content: "\\f09b"; }
+.td-search__icon:before {
+  content: "\\f002"; }
+.fa-solid {
+  font-weight: 900; }
+"""
+
+
+def write_site(tmp_path, html):
+    public = tmp_path / 'public'
+    (public / 'scss').mkdir(parents=True)
+    (public / 'js').mkdir()
+    (public / 'scss' / 'main.css').write_text(ICON_CSS, encoding='utf-8')
+    (public / 'js' / 'click-to-copy.js').write_text("button.classList.add('fa-regular', 'fa-copy');",
+                                                    encoding='utf-8')
+    (public / 'index.html').write_text(html, encoding='utf-8')
+    return public
+
+
+def test_read_icon_map():
+    """Tests if icon classes map to their codepoints and other glyph rules are always kept."""
+    icon_map, css_codepoints = read_icon_map([ICON_CSS])
+    assert icon_map == {'fa-bars': {0xf0c9}, 'fa-copy': {0xf0c5}, 'fa-github': {0xf09b}}
+    assert css_codepoints == {0xf002}
+
+
+def test_find_used_icons(tmp_path):
+    """Tests if the icons of the pages and scripts are found, ignoring classes that are not icons."""
+    public = write_site(tmp_path, '<i class="fa-brands fa-github"></i><a class="nav-fa-bars">')
+    icons, codepoints = find_used_icons(str(public))
+    assert icons == ['fa-copy', 'fa-github']
+    assert codepoints == [0xf002, 0xf09b, 0xf0c5]
+
+
+def test_subset_icon_fonts_without_font_tools(tmp_path, monkeypatch):
+    """Tests if the fonts are left unchanged when fontTools is not installed."""
+    public = write_site(tmp_path, '<i class="fa-solid fa-bars"></i>')
+    (public / 'webfonts').mkdir()
+    (public / 'webfonts' / 'fa-solid-900.ttf').write_bytes(b'full font')
+    monkeypatch.setattr(font_subset, 'font_subset', None)
+    result = subset_icon_fonts(str(public))
+    assert result == {'icons': ['fa-bars', 'fa-copy'], 'codepoints': 3, 'fonts': {}}
+    assert (public / 'webfonts' / 'fa-solid-900.ttf').read_bytes() == b'full font'
+
+
+def build_font(path, codepoints):
+    font_builder = pytest.importorskip('fontTools.fontBuilder')
+    glyph_pen = pytest.importorskip('fontTools.pens.ttGlyphPen')
+    glyphs = ['.notdef'] + [f"icon{codepoint:x}" for codepoint in codepoints]
+    builder = font_builder.FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyphs)
+    builder.setupCharacterMap({codepoint: f"icon{codepoint:x}" for codepoint in codepoints})
+    pen = glyph_pen.TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 500))
+    pen.lineTo((500, 500))
+    pen.closePath()
+    builder.setupGlyf({glyph: pen.glyph() for glyph in glyphs})
+    builder.setupHorizontalMetrics({glyph: (500, 0) for glyph in glyphs})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({'familyName': 'Icons', 'styleName': 'Regular'})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(str(path))
+
+
+def test_subset_icon_fonts(tmp_path):
+    """Tests if fonts keep only the used glyphs, subsets are reused, and a later build
+    finding a previous subset still subsets from the full font."""
+    ttLib = pytest.importorskip('fontTools.ttLib')
+    public = write_site(tmp_path, '<i class="fa-solid fa-bars"></i>')
+    (public / 'webfonts').mkdir()
+    font_path = public / 'webfonts' / 'fa-solid-900.ttf'
+    build_font(font_path, [0xf002, 0xf09b, 0xf0c5, 0xf0c9])
+    full_size = font_path.stat().st_size
+
+    result = subset_icon_fonts(str(public))
+    assert result['icons'] == ['fa-bars', 'fa-copy']
+    assert result['fonts']['fa-solid-900.ttf'][0] == full_size
+    assert set(ttLib.TTFont(str(font_path)).getBestCmap()) == {0xf002, 0xf0c5, 0xf0c9}
+    subset_bytes = font_path.read_bytes()
+
+    assert subset_icon_fonts(str(public))['fonts']['fa-solid-900.ttf'][1] == len(subset_bytes)
+    assert font_path.read_bytes() == subset_bytes
+
+    (public / 'index.html').write_text('<i class="fa-brands fa-github"></i>', encoding='utf-8')
+    subset_icon_fonts(str(public))
+    assert set(ttLib.TTFont(str(font_path)).getBestCmap()) == {0xf002, 0xf09b, 0xf0c5}
@@ -0,0 +1,93 @@
+import os
+from datetime import datetime
+
+import pytest
+from src.documentation import front_matter
+from src.documentation.front_matter import (
+    read_front_matter,
+    read_front_matter_block,
+    dump_front_matter,
+    split_front_matter,
+    join_front_matter,
+    clear_front_matter_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_front_matter_cache()
+    yield
+    clear_front_matter_cache()
+
+
+def test_read_front_matter_block_stops_at_closing_delimiter(tmp_path):
+    """Tests if only the leading block is returned."""
+    page = tmp_path / 'page.md'
+    page.write_text('---\ntitle: Page\n---\nBody\n---\nnot: front matter\n', encoding='utf-8')
+    assert read_front_matter_block(page) == 'title: Page\n'
+
+
+def test_read_front_matter_without_block(tmp_path):
+    """Tests if a file without front matter returns an empty dictionary."""
+    page = tmp_path / 'page.md'
+    page.write_text('# Title\n', encoding='utf-8')
+    assert read_front_matter(page) == {}
+
+
+def test_read_front_matter_uses_cache(tmp_path, monkeypatch):
+    """Tests if an unchanged file is parsed only once and a changed file is parsed again."""
+    page = tmp_path / 'page.md'
+    page.write_text('---\ntitle: Page\n---\nBody\n', encoding='utf-8')
+    calls = []
+    original_load = front_matter.load_front_matter
+    monkeypatch.setattr(front_matter, 'load_front_matter', lambda text: calls.append(text) or original_load(text))
+
+    assert read_front_matter(page) == {'title': 'Page'}
+    assert read_front_matter(page) == {'title': 'Page'}
+    assert len(calls) == 1
+
+    page.write_text('---\ntitle: Another page\n---\nBody\n', encoding='utf-8')
+    stat = os.stat(page)
+    os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_front_matter(page) == {'title': 'Another page'}
+    assert len(calls) == 2
+
+
+def test_dump_front_matter_datetime():
+    """Tests if datetimes are written as ISO timestamps."""
+    assert dump_front_matter({'date': datetime(2023, 11, 2, 10, 0, 0)}) == 'date: 2023-11-02T10:00:00\n'
+
+
+def test_split_and_join_front_matter():
+    """Tests if splitting a joined document returns the original parts."""
+    content = join_front_matter({'title': 'Page'}, 'Body\n')
+    assert content == '---\ntitle: Page\n---\nBody\n'
+    assert split_front_matter(content) == ({'title': 'Page'}, 'Body\n')
+    assert split_front_matter('Body\n') == ({}, 'Body\n')
+
+
+def test_read_front_matter_returns_deep_copy(tmp_path):
+    """Tests if changing nested values of the result does not change the cached front matter."""
+    page = tmp_path / 'page.md'
+    page.write_text('---\nparams:\n  tags: [a]\n---\nBody\n', encoding='utf-8')
+    read_front_matter(page)['params']['tags'].append('b')
+    assert read_front_matter(page) == {'params': {'tags': ['a']}}
+
+
+def test_read_front_matter_cache_is_bounded(tmp_path, monkeypatch):
+    """Tests if a changed file replaces its entry and the least recently used entries are dropped."""
+    monkeypatch.setattr(front_matter, 'FRONT_MATTER_CACHE_SIZE', 2)
+    pages = []
+    for index in range(3):
+        page = tmp_path / f'page{index}.md'
+        page.write_text(f'---\ntitle: Page {index}\n---\n', encoding='utf-8')
+        pages.append(page)
+
+    read_front_matter(pages[0])
+    pages[0].write_text('---\ntitle: Changed page\n---\n', encoding='utf-8')
+    assert read_front_matter(pages[0]) == {'title': 'Changed page'}
+    assert len(front_matter._front_matter_cache) == 1
+
+    read_front_matter(pages[1])
+    read_front_matter(pages[2])
+    assert list(front_matter._front_matter_cache) == [str(pages[1]), str(pages[2])]
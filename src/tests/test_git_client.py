@@ -0,0 +1,105 @@
+import asyncio
+import subprocess
+
+import pytest
+from src.git_client import AsyncGitClient, GitCommandError
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Creates a git repository with two committed files."""
+    def git(*args):
+        subprocess.run(["git", *args], check=True, cwd=tmp_path, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.name", "user1")
+    git("config", "user.email", "user1@example.com")
+    for file_name in ("first.md", "second.md"):
+        (tmp_path / file_name).write_text(file_name, encoding="utf-8")
+        git("add", file_name)
+        git("commit", "-q", "-m", f"Add {file_name}")
+    return tmp_path
+
+
+def test_get_files_creation_info(git_repo):
+    """Tests if the creation info of several files is returned, with errors as values."""
+    client = AsyncGitClient(str(git_repo), max_concurrency=2)
+    info = asyncio.run(client.get_files_creation_info(["first.md", "second.md", "missing.md"]))
+
+    assert info["first.md"]["author"] == "user1"
+    assert info["second.md"]["creation_date"]
+    assert isinstance(info["missing.md"], GitCommandError)
+
+
+def test_run_returns_structured_failure(git_repo):
+    """Tests if a failing command returns its exit code and error output instead of raising."""
+    result = asyncio.run(AsyncGitClient(str(git_repo)).run("log", "not-a-revision"))
+
+    assert not result.ok
+    assert result.returncode != 0
+    assert "not-a-revision" in result.stderr
+
+
+def test_run_timeout(git_repo):
+    """Tests if a command exceeding the timeout is reported as timed out."""
+    result = asyncio.run(AsyncGitClient(str(git_repo)).run("status", timeout=0))
+
+    assert result.timed_out
+    assert not result.ok
+
+
+def test_run_reports_process_start_failure(tmp_path):
+    """Tests if a missing repository path is reported as a failed result instead of raising."""
+    client = AsyncGitClient(str(tmp_path / "missing"))
+    result = asyncio.run(client.run("status"))
+
+    assert not result.ok
+    assert result.returncode is None and not result.timed_out
+    info = asyncio.run(client.get_files_creation_info(["first.md"]))
+    assert "could not be started" in str(info["first.md"])
+
+
+def test_run_cancelled_kills_process(git_repo, monkeypatch):
+    """Tests if cancelling the calling task kills the git process."""
+    processes = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def recording_create_subprocess_exec(*args, **kwargs):
+        process = await create_subprocess_exec(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_create_subprocess_exec)
+
+    async def cancel_run():
+        client = AsyncGitClient(str(git_repo))
+        task = asyncio.create_task(client.run("-c", "alias.zz=!exec sleep 5 >/dev/null 2>&1", "zz"))
+        while not processes:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_run())
+    assert processes[0].returncode is not None
+
+
+def test_client_reused_across_event_loops(git_repo):
+    """Tests if a client with contended slots works in several successive event loops."""
+    client = AsyncGitClient(str(git_repo), max_concurrency=1)
+    for _ in range(2):
+        info = asyncio.run(client.get_files_creation_info(["first.md", "second.md"]))
+        assert info["first.md"]["author"] == "user1"
+        assert info["second.md"]["author"] == "user1"
+
+
+def test_run_replaces_undecodable_output(git_repo):
+    """Tests if output that is not UTF-8, such as a Latin-1 author name, does not raise."""
+    (git_repo / "third.md").write_text("third", encoding="utf-8")
+    subprocess.run(["git", "add", "third.md"], check=True, cwd=git_repo)
+    subprocess.run(["git", "-c", "user.name=José", "commit", "-q", "-m", "Add third.md"], check=True, cwd=git_repo)
+    subprocess.run(["git", "config", "i18n.logOutputEncoding", "ISO-8859-1"], check=True, cwd=git_repo)
+
+    info = asyncio.run(AsyncGitClient(str(git_repo)).get_file_creation_info("third.md"))
+
+    assert info["author"] == "Jos\ufffd"
@@ -0,0 +1,33 @@
+from src.documentation.journal import SyncJournal
+
+
+def test_journal_survives_reload_and_ignores_truncated_line(tmp_path):
+    """Tests if completed items are read back and a partially written last line is dropped before recording."""
+    journal_path = tmp_path / 'journal.jsonl'
+    destination = tmp_path / 'page.md'
+    destination.write_text('page', encoding='utf-8')
+    SyncJournal(str(journal_path)).record('source.md', 'hash', str(destination), result='ai/result.json')
+    with open(journal_path, 'a', encoding='utf-8') as file:
+        file.write('{"source": "other.md", "source_ha')
+
+    journal = SyncJournal(str(journal_path))
+    journal.load()
+
+    assert journal.completed('source.md', 'hash', str(destination))['result'] == 'ai/result.json'
+    assert journal.completed('source.md', 'changed-hash', str(destination)) is None
+    assert journal.completed('other.md', 'hash', str(destination)) is None
+
+    journal.record('b.md', 'hash', str(destination))
+    resumed = SyncJournal(str(journal_path))
+    resumed.load()
+    assert set(resumed.items) == {'source.md', 'b.md'}
+
+
+def test_journal_requires_destination(tmp_path):
+    """Tests if an item whose destination disappeared must be processed again."""
+    journal = SyncJournal(str(tmp_path / 'journal.jsonl'))
+    journal.record('source.md', 'hash', str(tmp_path / 'missing.md'))
+    assert journal.completed('source.md', 'hash', str(tmp_path / 'missing.md')) is None
+
+    journal.clear()
+    assert not (tmp_path / 'journal.jsonl').exists()
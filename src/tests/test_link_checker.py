@@ -0,0 +1,44 @@
+from src.documentation.link_checker import TARGET_PATTERN, check_links, heading_anchor
+from src.documentation.markdown import LINK_PATTERN
+
+
+def test_heading_anchor():
+    """Tests if anchors follow the Hugo heading ids."""
+    assert heading_anchor('Explicação da Arquitetura') == 'explicação-da-arquitetura'
+    assert heading_anchor('AWS `Lambda` & S3') == 'aws-lambda--s3'
+    assert heading_anchor('Models {#models}') == 'models'
+
+
+def test_check_links(tmp_path):
+    """Tests if missing files and anchors are reported and valid references are not."""
+    docs = tmp_path / 'content' / 'en' / 'docs' / 'repo'
+    (docs / 'images').mkdir(parents=True)
+    (docs / 'images' / 'architecture.png').touch()
+    (tmp_path / 'static' / 'assets' / 'ab').mkdir(parents=True)
+    (tmp_path / 'static' / 'assets' / 'ab' / 'abc.png').touch()
+    (docs / 'other.md').write_text('---\ntitle: Other\n---\n## Setup\n## Setup\n', encoding='utf-8')
+    (docs / 'overview.md').write_text(
+        '---\ntitle: Overview\n---\n'
+        '## Diagram\n'
+        '![Diagram](images/architecture.png) ![Stored](/assets/ab/abc.png)\n'
+        '[Setup](other.md#setup-1) [Self](#diagram) [Site](https://deployo.io) [Section](../repo)\n'
+        '![Missing](images/missing.png) [Bad anchor](other.md#install) [Bad self](#nothing)\n'
+        '```\n[Ignored](in-code.md)\n```\n',
+        encoding='utf-8')
+    (docs / '_index.md').write_text('# Repo\n', encoding='utf-8')
+
+    broken = check_links(str(tmp_path))
+
+    assert [(item['target'], item['reason']) for item in broken] == [
+        ('images/missing.png', 'missing file'),
+        ('other.md#install', 'missing anchor'),
+        ('#nothing', 'missing anchor')
+    ]
+    assert all(item['page'] == str(docs / 'overview.md') for item in broken)
+
+
+def test_target_pattern_matches_link_pattern():
+    """Tests if the checker finds the same targets the sync rewrites."""
+    text = ('![Diagram](images/Architecture.png "title") [Other](<Other Page.md>#section) '
+            '[Site](https://deployo.io) [Top](#top) [ Spaced ]( ../guide.md )')
+    assert TARGET_PATTERN.findall(text) == [match.group(2) for match in LINK_PATTERN.finditer(text)]
@@ -0,0 +1,60 @@
+import calendar
+import gzip
+import logging
+import os
+
+from src.logging_config import MonthlyRotatingFileHandler
+
+
+def make_record(created):
+    record = logging.LogRecord('test', logging.INFO, __file__, 1, 'message at %s', (created,), None)
+    record.created = created
+    return record
+
+
+def month_start(year, month):
+    return calendar.timegm((year, month, 1, 12, 0, 0))
+
+
+def test_no_rollover_within_month(tmp_path):
+    """Tests if records of the same month stay in the current file."""
+    handler = MonthlyRotatingFileHandler(str(tmp_path / 'ai.log'))
+    handler.month = '2025-04'
+    assert not handler.shouldRollover(make_record(month_start(2025, 4) + 60))
+    assert handler.shouldRollover(make_record(month_start(2025, 5)))
+    handler.close()
+
+
+def test_rollover_moves_month_and_keeps_backups(tmp_path):
+    """Tests if the finished month is renamed with its month and old months are deleted."""
+    log_file = tmp_path / 'ai.log'
+    (tmp_path / 'ai.log.2025-01').write_text('old\n', encoding='utf-8')
+    (tmp_path / 'ai.log.2025-02').write_text('older\n', encoding='utf-8')
+    handler = MonthlyRotatingFileHandler(str(log_file), backup_count=2)
+    handler.month = '2025-03'
+    handler.stream.write('march\n')
+
+    handler.doRollover()
+    handler.close()
+
+    assert (tmp_path / 'ai.log.2025-03').read_text(encoding='utf-8') == 'march\n'
+    assert not (tmp_path / 'ai.log.2025-01').exists()
+    assert (tmp_path / 'ai.log.2025-02').exists()
+    assert log_file.read_text(encoding='utf-8') == ''
+
+
+def test_rollover_compresses_and_appends(tmp_path):
+    """Tests if compressed months are appended to an existing archive of the same month."""
+    log_file = tmp_path / 'ai.log'
+    with gzip.open(tmp_path / 'ai.log.2025-03.gz', 'wt', encoding='utf-8') as archive:
+        archive.write('first\n')
+    handler = MonthlyRotatingFileHandler(str(log_file), compress=True)
+    handler.month = '2025-03'
+    handler.stream.write('second\n')
+
+    handler.doRollover()
+    handler.close()
+
+    with gzip.open(tmp_path / 'ai.log.2025-03.gz', 'rt', encoding='utf-8') as archive:
+        assert archive.read() == 'first\nsecond\n'
+    assert sorted(os.listdir(tmp_path)) == ['ai.log', 'ai.log.2025-03.gz']
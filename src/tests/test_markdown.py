@@ -1,7 +1,8 @@
 import re
 from pathlib import Path
 import pytest
-from src.documentation.markdown import Markdown
+from src.documentation.file_handler import FileHandler, build_destination_path
+from src.documentation.markdown import Markdown, extract_references, rewrite_references
 
 
 @pytest.fixture
@@ -19,7 +20,7 @@ def test_merge_files_source_only_git(markdown_files, mocker):
     # Arrange
     mock_get_file_creation_info = mocker.patch(
         'src.git_client.GitClient.get_file_creation_info',
-        return_value={'created_at': '2023-11-02T10:00:00', 'author': 'user1'}
+        return_value={'creation_date': '2023-11-02 10:00:00 +0000', 'author': 'user1'}
     )
 
     mock_generate_summary = mocker.patch(
@@ -41,10 +42,37 @@ def test_merge_files_source_only_git(markdown_files, mocker):
     front_matter = front_matter_match.group(1)
     content_body = re.sub(r'^---\n.*?\n---\n', '', merged_content, flags=re.DOTALL)
 
-    assert "date: 2023-11-02T10:00:00" in front_matter, "Date in front matter is incorrect"
+    assert "date: 2023-11-02T10:00:00+00:00" in front_matter, "Date in front matter is incorrect"
     assert "author: user1" in front_matter, "Author in front matter is incorrect"
     assert "title: Title 1" in front_matter, "Title in front matter is incorrect"
     assert not re.search(r'^# Title 1', content_body), "Title should not be present in the content section"
     assert "<!-- One liner -->" not in content_body, "One-line comment should not be present in the content section"
 
-    mock_get_file_creation_info.assert_called_once_with(markdown_files['source_file_correct'])
\ No newline at end of file
+    mock_get_file_creation_info.assert_called_once_with(str(markdown_files['source_file_correct'].resolve()))
+
+def test_extract_references():
+    """
+    Test if only local link and image targets are extracted, without anchors or duplicates.
+    """
+    text = ("![Diagram](images/Architecture.png) [Other](OtherPage.md#section) "
+            "[Site](https://deployo.io) [Top](#top) ![Again](images/Architecture.png \"title\")")
+    assert extract_references(text) == ['images/Architecture.png', 'OtherPage.md']
+
+
+def test_rewrite_references(tmp_path):
+    """
+    Test if local targets are rewritten to kebab-cased destination paths relative to the target file.
+    """
+    source_repo = tmp_path / 'MySourceRepository'
+    images = source_repo / 'docs' / 'en' / 'images'
+    images.mkdir(parents=True)
+    (images / 'Architecture.png').touch()
+    page = source_repo / 'docs' / 'en' / 'Overview.md'
+    page.touch()
+    file_handler = FileHandler(str(source_repo), str(tmp_path / 'site'))
+    target = build_destination_path(file_handler, str(page))
+
+    text = "![Diagram](images/Architecture.png) [Missing](images/Missing.png) [Anchor](Overview.md#intro)"
+    rewritten = rewrite_references(text, str(page), target, file_handler)
+
+    assert rewritten == "![Diagram](images/architecture.png) [Missing](images/Missing.png) [Anchor](overview.md#intro)"
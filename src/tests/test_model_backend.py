@@ -0,0 +1,84 @@
+import pytest
+from src.documentation.generate_ai_content import generate_ai_content
+from src.documentation.model_backend import (
+    BackendError,
+    Chunk,
+    FakeBackend,
+    ModelBackend,
+    RateLimitError,
+    RecordingBackend,
+    UsageMetadata
+)
+from src.logging_config import stop_logging
+
+
+@pytest.fixture(autouse=True)
+def stopped_logging():
+    """Stops the log listener started by generate_ai_content, so it does not outlive the test."""
+    yield
+    stop_logging()
+
+
+class StaticBackend(ModelBackend):
+    """Backend returning fixed chunks, standing in for the Gemini API."""
+
+    def generate_content_stream(self, model, text, system_instruction):
+        return iter([
+            Chunk("summaries\n\npt-br: Resumo gravado.\nen: Recorded summary.\n"),
+            Chunk("descriptions\n\npt-br: Descrição gravada.\nen: Recorded description.\n",
+                  UsageMetadata(100, 20, 120))
+        ])
+
+
+def test_generate_ai_content_with_fake_backend(tmp_path):
+    """Tests if the summaries, descriptions and token usage are parsed from the fake stream."""
+    result = generate_ai_content("# Title\n\nBody text", log_file_base_path=str(tmp_path / 'ai.log'),
+                                 backend=FakeBackend(chunk_size=16))
+
+    assert result["summaries"]["en"] == "Summary generated locally for tests."
+    assert result["descriptions"]["pt-br"] == "Descrição gerada localmente."
+    assert result["tokens"]["input_tokens"] == 4
+    assert result["tokens"]["total_tokens"] > result["tokens"]["input_tokens"]
+
+
+def test_record_and_replay(tmp_path):
+    """Tests if chunks recorded from a backend are replayed by the fake backend."""
+    recording = tmp_path / 'recording.json'
+    recorded = list(RecordingBackend(StaticBackend(), str(recording)).generate_content_stream(
+        "gemini-2.0-flash", "# Title", "instruction"))
+
+    replayed = list(FakeBackend(recording_path=str(recording)).generate_content_stream(
+        "gemini-2.0-flash", "# Title", "instruction"))
+
+    assert [chunk.text for chunk in replayed] == [chunk.text for chunk in recorded]
+    assert replayed[0].usage_metadata is None
+    assert replayed[1].usage_metadata.total_token_count == 120
+
+    changed_prompt = list(FakeBackend(recording_path=str(recording)).generate_content_stream(
+        "gemini-2.0-flash", "# Title", "changed instruction"))
+    assert "".join(chunk.text for chunk in changed_prompt) != "".join(chunk.text for chunk in recorded)
+
+
+def test_model_backend_is_abstract():
+    """Tests if a backend must implement generate_content_stream."""
+    class IncompleteBackend(ModelBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+def test_fake_backend_rate_limit():
+    """Tests if requests above the per-minute limit are rejected."""
+    backend = FakeBackend(requests_per_minute=2)
+    backend.generate_content_stream("model", "text", "instruction")
+    backend.generate_content_stream("model", "text", "instruction")
+    with pytest.raises(RateLimitError):
+        backend.generate_content_stream("model", "text", "instruction")
+
+
+def test_fake_backend_error_injection():
+    """Tests if errors are injected at the configured rate."""
+    with pytest.raises(BackendError):
+        FakeBackend(error_rate=1.0).generate_content_stream("model", "text", "instruction")
+    assert list(FakeBackend(error_rate=0.0).generate_content_stream("model", "text", "instruction"))
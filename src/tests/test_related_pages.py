@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from src.documentation import related_pages
+from src.documentation.front_matter import split_front_matter
+from src.documentation.related_pages import tfidf_matrix, top_k_similar, update_related_pages
+
+
+def write_page(content_path, name, title, body):
+    page = content_path / f"{name}.md"
+    page.write_text(f"---\ntitle: {title}\n---\n{body}\n", encoding='utf-8')
+    return page
+
+
+def test_top_k_similar():
+    """Tests if documents are ranked by shared terms and unrelated documents are left out."""
+    counts = [
+        {'lambda': 2, 'spring': 1},
+        {'lambda': 1, 'spring': 1, 'latex': 1},
+        {'latex': 3},
+        {'oauth': 1}
+    ]
+    assert top_k_similar(tfidf_matrix(counts), 2) == [[1], [0, 2], [1], []]
+    assert top_k_similar(tfidf_matrix(counts), 2, block_size=3) == [[1], [0, 2], [1], []]
+
+
+def test_update_related_pages(tmp_path, monkeypatch):
+    """Tests if related URLs are written to the front matter and unchanged pages are not re-vectorized."""
+    content_path = tmp_path / 'content' / 'en' / 'docs'
+    content_path.mkdir(parents=True)
+    lambda_page = write_page(content_path, 'lambda', 'Lambda', 'AWS Lambda deployment of Spring Boot')
+    write_page(content_path, 'spring', 'Spring', 'Spring Boot controllers deployed on AWS Lambda')
+    write_page(content_path, 'latex', 'Latex', 'Resume templates rendered with LaTeX')
+
+    updated = update_related_pages(str(tmp_path), k=1)
+
+    assert len(updated) == 2
+    front_matter, _ = split_front_matter(lambda_page.read_text(encoding='utf-8'))
+    assert front_matter == {'title': 'Lambda', 'related': ['/en/docs/spring/']}
+
+    monkeypatch.setattr(related_pages, 'tokenize', lambda *args: pytest.fail('cached page was re-vectorized'))
+    assert update_related_pages(str(tmp_path), k=1) == []
+
+
+def test_update_related_pages_leaves_other_front_matter_formats(tmp_path):
+    """Tests if pages with TOML or no front matter are candidates but are never rewritten."""
+    content_path = tmp_path / 'content' / 'en' / 'docs'
+    content_path.mkdir(parents=True)
+    lambda_page = write_page(content_path, 'lambda', 'Lambda', 'AWS Lambda deployment of Spring Boot')
+    toml_page = content_path / 'spring.md'
+    toml_content = "+++\ntitle = 'Spring'\n+++\nSpring Boot controllers deployed on AWS Lambda\n"
+    toml_page.write_text(toml_content, encoding='utf-8')
+    plain_page = content_path / 'boot.md'
+    plain_page.write_text('Spring Boot on AWS Lambda\n', encoding='utf-8')
+
+    assert update_related_pages(str(tmp_path), k=2) == [str(lambda_page)]
+
+    front_matter, _ = split_front_matter(lambda_page.read_text(encoding='utf-8'))
+    assert sorted(front_matter['related']) == ['/en/docs/boot/', '/en/docs/spring/']
+    assert toml_page.read_text(encoding='utf-8') == toml_content
+    assert plain_page.read_text(encoding='utf-8') == 'Spring Boot on AWS Lambda\n'
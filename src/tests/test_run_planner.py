@@ -0,0 +1,40 @@
+from src.documentation.run_planner import downgrade_models, estimate_document_tokens, plan_run
+from src.documentation.token_cost import estimate_cost
+
+
+def test_downgrade_models():
+    """Tests if the preferred model comes first, followed by cheaper models."""
+    assert downgrade_models("gemini-2.0-flash") == [
+        "gemini-2.0-flash", "gemini-2.0-flash-lite", "gemini-1.5-flash", "gemini-1.5-flash-8b"
+    ]
+    assert downgrade_models("gemini-1.5-flash-8b") == ["gemini-1.5-flash-8b"]
+
+
+def test_plan_run_within_budget():
+    """Tests if every document gets the preferred model when the budget is enough."""
+    plan = plan_run([("a.md", "a" * 4000), ("b.md", "b" * 4000)], budget=1.0)
+
+    assert [item["model"] for item in plan["items"]] == ["gemini-2.0-flash", "gemini-2.0-flash"]
+    assert plan["skipped"] == []
+    assert plan["total_cost"] == sum(item["cost"] for item in plan["items"])
+
+
+def test_plan_run_downgrades_then_stops():
+    """Tests if the model is downgraded when the preferred one does not fit, and the run stops after."""
+    text = "a" * 40_000
+    input_tokens, output_tokens = estimate_document_tokens(text)
+    budget = (estimate_cost("gemini-2.0-flash", input_tokens, output_tokens)
+              + estimate_cost("gemini-1.5-flash-8b", input_tokens, output_tokens))
+
+    plan = plan_run([("a.md", text), ("b.md", text), ("c.md", text)], budget=budget)
+
+    assert [item["model"] for item in plan["items"]] == ["gemini-2.0-flash", "gemini-1.5-flash-8b"]
+    assert plan["skipped"] == ["c.md"]
+
+
+def test_plan_run_without_downgrade():
+    """Tests if the run stops at the first document over budget when downgrades are not allowed."""
+    plan = plan_run([("a.md", "a" * 40_000)], budget=0.000001, allow_downgrade=False)
+
+    assert plan["items"] == []
+    assert plan["skipped"] == ["a.md"]
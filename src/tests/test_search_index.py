@@ -0,0 +1,83 @@
+import json
+
+from src.documentation.search_index import (
+    stem,
+    tokenize,
+    page_url,
+    build_search_index,
+    build_search_indexes
+)
+
+
+def test_stem():
+    """Tests the light stemmers of both languages."""
+    assert stem('summaries', 'en') == 'summary'
+    assert stem('running', 'en') == 'run'
+    assert stem('stopped', 'en') == 'stop'
+    assert stem('falling', 'en') == 'fall'
+    assert stem('spring', 'en') == 'spring'
+    for plural, singular in [('images', 'image'), ('resumes', 'resume'), ('services', 'service'),
+                             ('templates', 'template'), ('branches', 'branch'), ('classes', 'class')]:
+        assert stem(plural, 'en') == stem(singular, 'en')
+    assert stem('branches', 'en') == 'branch'
+    assert stem('configurações', 'pt-br') == 'configuração'
+    assert stem('currículos', 'pt-br') == 'currículo'
+
+
+def test_tokenize_drops_stop_words_and_markdown_noise():
+    """Tests if stop words, code and link targets are not indexed."""
+    text = "The `code` of the [Resume](images/Architecture.png) builders"
+    assert tokenize(text, 'en') == ['resume', 'builder']
+
+
+def test_page_url():
+    """Tests if content paths are mapped to Hugo URLs."""
+    assert page_url('/site/content/en', '/site/content/en/docs/repo/overview.md', 'en') == '/en/docs/repo/overview/'
+    assert page_url('/site/content/pt-br', '/site/content/pt-br/blog/_index.md', 'pt-br') == '/pt-br/blog/'
+
+
+def test_build_search_index_weights_title():
+    """Tests if title terms weigh more than body terms."""
+    pages = [
+        {'url': '/en/a/', 'title': 'Lambda', 'summary': '', 'text': 'spring'},
+        {'url': '/en/b/', 'title': 'Spring', 'summary': '', 'text': 'lambda lambda'}
+    ]
+    documents, postings = build_search_index(pages, 'en')
+    assert [document['url'] for document in documents] == ['/en/a/', '/en/b/']
+    assert postings['lambda'] == [[0, 5], [1, 2]]
+    assert postings['spring'] == [[1, 5], [0, 1]]
+
+
+def test_build_search_indexes_writes_shards(tmp_path):
+    """Tests if each language gets its documents, manifest and term prefix shards."""
+    page = tmp_path / 'content' / 'en' / 'docs' / 'overview.md'
+    page.parent.mkdir(parents=True)
+    page.write_text('---\ntitle: Overview\nsummary: Serverless resume builder\n---\nDeploy with lambda\n',
+                    encoding='utf-8')
+
+    manifests = build_search_indexes(str(tmp_path))
+
+    assert manifests['en']['documents'] == 1
+    assert manifests['en']['stem_suffixes'][0] == ['ies', 'y']
+    assert manifests['pt-br']['documents'] == 0
+    assert manifests['pt-br']['shards'] == []
+    index_path = tmp_path / 'static' / 'search' / 'en'
+    documents = json.loads((index_path / 'documents.json').read_text(encoding='utf-8'))
+    assert documents == [{'url': '/en/docs/overview/', 'title': 'Overview', 'summary': 'Serverless resume builder'}]
+    shard = json.loads((index_path / 'shards' / 'la.json').read_text(encoding='utf-8'))
+    assert shard == {'lambda': [[0, 1]]}
+
+
+def test_build_search_indexes_skips_invalid_front_matter(tmp_path, capsys):
+    """Tests if a page with invalid front matter is indexed by its body instead of aborting the build."""
+    content = tmp_path / 'content' / 'en' / 'docs'
+    content.mkdir(parents=True)
+    (content / 'broken.md').write_text('---\ntitle: [unclosed\n---\nDeploy with lambda\n', encoding='utf-8')
+    (content / 'overview.md').write_text('---\ntitle: Overview\n---\nBody\n', encoding='utf-8')
+
+    manifests = build_search_indexes(str(tmp_path))
+
+    assert manifests['en']['documents'] == 2
+    assert 'broken.md' in capsys.readouterr().err
+    documents = json.loads((tmp_path / 'static' / 'search' / 'en' / 'documents.json').read_text(encoding='utf-8'))
+    assert [document['title'] for document in documents] == ['', 'Overview']
@@ -0,0 +1,79 @@
+import gzip
+import json
+
+import pytest
+
+from src.publish import static_assets
+from src.publish.static_assets import process_static_assets, rewrite_css_urls
+
+
+def test_rewrite_css_urls():
+    """Tests if relative font urls point to the fingerprinted fonts, keeping query and fragment."""
+    manifest = {'webfonts/fa-solid-900.woff2': 'webfonts/fa-solid-900.0123456789.woff2'}
+    css = 'src:url("../webfonts/fa-solid-900.woff2?v=6#x") url(data:image/svg+xml,abc) url(../webfonts/other.ttf)'
+    assert rewrite_css_urls(css, 'scss/main.css', manifest) == (
+        'src:url("../webfonts/fa-solid-900.0123456789.woff2?v=6#x") url(data:image/svg+xml,abc) '
+        'url(../webfonts/other.ttf)'
+    )
+
+
+def test_process_static_assets(tmp_path):
+    """Tests if assets are fingerprinted and precompressed, and unchanged files are skipped on the next run."""
+    public = tmp_path / 'public'
+    (public / 'js').mkdir(parents=True)
+    (public / 'webfonts').mkdir()
+    (public / 'scss').mkdir()
+    (public / 'js' / 'main.js').write_text('console.log("main");\n' * 50, encoding='utf-8')
+    (public / 'webfonts' / 'fa-solid-900.woff2').write_bytes(b'font')
+    (public / 'scss' / 'main.css').write_text('@font-face{src:url("../webfonts/fa-solid-900.woff2")}\n' * 20,
+                                              encoding='utf-8')
+    (public / 'index.html').write_text('<link href="/scss/main.css"><script src="/js/main.js"></script>\n' * 20
+                                       + "<script src='/js/main.js'></script>\n", encoding='utf-8')
+
+    result = process_static_assets(str(public), max_workers=2)
+
+    manifest = json.loads((public / 'assets-manifest.json').read_text(encoding='utf-8'))
+    assert manifest == result['manifest']
+    assert set(manifest) == {'js/main.js', 'scss/main.css', 'webfonts/fa-solid-900.woff2'}
+    fingerprinted_css = (public / manifest['scss/main.css']).read_text(encoding='utf-8')
+    assert f'../{manifest["webfonts/fa-solid-900.woff2"]}' in fingerprinted_css
+    html = (public / 'index.html').read_text(encoding='utf-8')
+    assert f'src="/{manifest["js/main.js"]}"' in html
+    assert f"src='/{manifest['js/main.js']}'" in html
+    with gzip.open(public / 'index.html.gz', 'rt', encoding='utf-8') as compressed:
+        assert compressed.read() == html
+    assert (public / f'{manifest["js/main.js"]}.gz').exists()
+
+    assert process_static_assets(str(public))['compressed'] == []
+
+    (public / f'{manifest["js/main.js"]}.gz').unlink()
+    # The missing sibling recompresses the file, rewriting its .br sibling as well when brotli is installed.
+    suffixes = ['.gz', '.br'] if static_assets.brotli is not None else ['.gz']
+    assert process_static_assets(str(public))['compressed'] == [
+        str(public / f'{manifest["js/main.js"]}{suffix}') for suffix in suffixes
+    ]
+
+    (public / 'js' / 'main.js').write_text('console.log("changed");\n' * 50, encoding='utf-8')
+    second = process_static_assets(str(public))
+    assert second['manifest']['js/main.js'] != manifest['js/main.js']
+    assert not (public / manifest['js/main.js']).exists()
+    assert not (public / f'{manifest["js/main.js"]}.gz').exists()
+
+
+def test_process_static_assets_brotli(tmp_path):
+    """Tests if the .br sibling is written when brotli is installed, and written again when it goes missing."""
+    brotli = pytest.importorskip('brotli')
+    public = tmp_path / 'public'
+    (public / 'js').mkdir(parents=True)
+    (public / 'js' / 'main.js').write_text('console.log("main");\n' * 50, encoding='utf-8')
+
+    manifest = process_static_assets(str(public))['manifest']
+
+    compressed_path = public / f'{manifest["js/main.js"]}.br'
+    original = (public / manifest['js/main.js']).read_bytes()
+    assert brotli.decompress(compressed_path.read_bytes()) == original
+    assert process_static_assets(str(public))['compressed'] == []
+
+    compressed_path.unlink()
+    assert str(compressed_path) in process_static_assets(str(public))['compressed']
+    assert brotli.decompress(compressed_path.read_bytes()) == original
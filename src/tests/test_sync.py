@@ -0,0 +1,143 @@
+import os
+import subprocess
+
+import pytest
+from src.documentation.file_handler import FileHandler
+from src.documentation.sync import sync_documentation
+from src.utils import file_sha256
+
+
+@pytest.fixture
+def source_repo(tmp_path, monkeypatch):
+    """Creates a source repository with one page, one referenced image and one unused image."""
+    monkeypatch.setattr(
+        'src.git_client.GitClient.get_file_creation_info',
+        lambda self, file_path: {'creation_date': '2023-11-02 10:00:00 +0000', 'author': 'user1'}
+    )
+    repo = tmp_path / 'MySourceRepository'
+    images = repo / 'docs' / 'en' / 'images'
+    images.mkdir(parents=True)
+    (images / 'Architecture.png').write_bytes(b'diagram')
+    (images / 'Unused.png').write_bytes(b'unused')
+    (repo / 'docs' / 'en' / 'Overview.md').write_text(
+        '# Overview\n\n![Diagram](images/Architecture.png)\n', encoding='utf-8')
+    return repo
+
+
+def test_sync_copies_only_referenced_assets(source_repo, tmp_path):
+    """Tests if referenced images are copied and links are rewritten to their destination."""
+    destination = tmp_path / 'site'
+    result = sync_documentation(FileHandler(str(source_repo), str(destination)))
+
+    docs = destination / 'content' / 'en' / 'docs' / 'my-source-repository'
+    assert result['pages'] == [str(docs / 'overview.md')]
+    assert result['assets'] == [str(docs / 'images' / 'architecture.png')]
+    assert (docs / 'images' / 'architecture.png').read_bytes() == b'diagram'
+    assert not (docs / 'images' / 'unused.png').exists()
+    assert '![Diagram](images/architecture.png)' in (docs / 'overview.md').read_text(encoding='utf-8')
+
+
+def test_sync_removes_pages_of_deleted_sources(source_repo, tmp_path):
+    """Tests if the destination page of a deleted source page is removed from the content tree."""
+    (source_repo / 'docs' / 'en' / 'Setup.md').write_text('# Setup\n\nSteps.\n', encoding='utf-8')
+    file_handler = FileHandler(str(source_repo), str(tmp_path / 'site'))
+    sync_documentation(file_handler)
+    setup_page = tmp_path / 'site' / 'content' / 'en' / 'docs' / 'my-source-repository' / 'setup.md'
+    assert setup_page.exists()
+
+    (source_repo / 'docs' / 'en' / 'Setup.md').unlink()
+    assert sync_documentation(file_handler)['removed'] == [str(setup_page)]
+    assert not setup_page.exists()
+
+
+def test_sync_rerenders_only_changed_dependencies(source_repo, tmp_path):
+    """Tests if a second run does nothing and a changed image re-renders its page."""
+    file_handler = FileHandler(str(source_repo), str(tmp_path / 'site'))
+    sync_documentation(file_handler)
+
+    assert sync_documentation(file_handler) == {'pages': [], 'assets': [], 'removed': []}
+
+    (source_repo / 'docs' / 'en' / 'images' / 'Architecture.png').write_bytes(b'new diagram')
+    result = sync_documentation(file_handler)
+    assert len(result['pages']) == 1
+    assert len(result['assets']) == 1
+
+
+def test_sync_writes_identical_images_once_to_asset_store(source_repo, tmp_path):
+    """Tests if identical images of both languages are stored once and linked by URL."""
+    pt_br = source_repo / 'docs' / 'pt-br'
+    (pt_br / 'images').mkdir(parents=True)
+    (pt_br / 'images' / 'Arquitetura.png').write_bytes(b'diagram')
+    (pt_br / 'VisaoGeral.md').write_text('# Visão geral\n\n![Diagrama](images/Arquitetura.png)\n',
+                                         encoding='utf-8')
+    destination = tmp_path / 'site'
+
+    result = sync_documentation(FileHandler(str(source_repo), str(destination), use_asset_store=True))
+
+    content_hash = file_sha256(source_repo / 'docs' / 'en' / 'images' / 'Architecture.png')
+    stored = destination / 'static' / 'assets' / content_hash[:2] / f"{content_hash}.png"
+    assert result['assets'] == [str(stored)]
+    assert stored.read_bytes() == b'diagram'
+    url = f"/assets/{content_hash[:2]}/{content_hash}.png"
+    en_page = destination / 'content' / 'en' / 'docs' / 'my-source-repository' / 'overview.md'
+    pt_br_page = destination / 'content' / 'pt-br' / 'docs' / 'my-source-repository' / 'visao-geral.md'
+    assert f'![Diagram]({url})' in en_page.read_text(encoding='utf-8')
+    assert f'![Diagrama]({url})' in pt_br_page.read_text(encoding='utf-8')
+    assert not (destination / 'content' / 'en' / 'docs' / 'my-source-repository' / 'images').exists()
+
+
+def test_sync_resumes_interrupted_run(source_repo, tmp_path, monkeypatch):
+    """Tests if a run interrupted after rendering the pages does not render them again."""
+    file_handler = FileHandler(str(source_repo), str(tmp_path / 'site'))
+
+    def interrupt(*args):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr('src.documentation.sync.optimize_images', interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        sync_documentation(file_handler)
+    assert (tmp_path / 'site' / '.cache' / 'sync-journal.jsonl').exists()
+
+    monkeypatch.undo()
+    monkeypatch.setattr('src.documentation.markdown.Markdown.merge_files',
+                        lambda self: pytest.fail('completed page was rendered again'))
+    result = sync_documentation(file_handler)
+
+    assert result['pages'] == [str(tmp_path / 'site' / 'content' / 'en' / 'docs' / 'my-source-repository' / 'overview.md')]
+    assert len(result['assets']) == 1
+    assert not (tmp_path / 'site' / '.cache' / 'sync-journal.jsonl').exists()
+
+
+def test_sync_git_repository(tmp_path):
+    """Tests a sync of a real git repository: creation date and author come from the first commit,
+    and the body keeps its line breaks."""
+    repo = tmp_path / 'MySourceRepository'
+    (repo / 'docs' / 'en').mkdir(parents=True)
+    (repo / 'docs' / 'en' / 'Overview.md').write_text(
+        '# Overview\n\n| Name | Value |\n|------|-------|\n| a    | 1     |\n\n- first\n- second\n',
+        encoding='utf-8')
+
+    def git(*args, date=None):
+        env = {'GIT_AUTHOR_DATE': date, 'GIT_COMMITTER_DATE': date} if date else {}
+        subprocess.run(['git', *args], check=True, cwd=repo, capture_output=True,
+                       env={**os.environ, **env})
+
+    git('init', '-q')
+    git('config', 'user.name', 'user1')
+    git('config', 'user.email', 'user1@example.com')
+    git('add', '.')
+    git('commit', '-q', '-m', 'Add overview', date='2023-11-02T10:00:00+0000')
+    git('config', 'user.name', 'user2')
+    (repo / 'docs' / 'en' / 'Overview.md').write_text('# Overview\n\nChanged.\n', encoding='utf-8')
+    git('commit', '-q', '-am', 'Change overview', date='2024-01-01T10:00:00+0000')
+    (repo / 'docs' / 'en' / 'Overview.md').write_text(
+        '# Overview\n\n| Name | Value |\n|------|-------|\n| a    | 1     |\n\n- first\n- second\n',
+        encoding='utf-8')
+
+    sync_documentation(FileHandler(str(repo), str(tmp_path / 'site')))
+
+    page = tmp_path / 'site' / 'content' / 'en' / 'docs' / 'my-source-repository' / 'overview.md'
+    assert page.read_text(encoding='utf-8') == (
+        '---\ndate: 2023-11-02T10:00:00+00:00\nparams:\n  author: user1\ntitle: Overview\n---\n'
+        '\n| Name | Value |\n|------|-------|\n| a    | 1     |\n\n- first\n- second\n'
+    )
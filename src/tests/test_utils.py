@@ -0,0 +1,39 @@
+import os
+import stat
+
+import pytest
+
+from src.utils import atomic_copy, atomic_write
+
+
+def file_mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.fixture
+def umask_022():
+    umask = os.umask(0o022)
+    yield
+    os.umask(umask)
+
+
+def test_atomic_write_new_file_mode(tmp_path, umask_022):
+    """Tests if a new file gets the mode of a plain open() instead of an owner-only mode."""
+    atomic_write(str(tmp_path / 'page.md'), 'content')
+    atomic_copy(str(tmp_path / 'page.md'), str(tmp_path / 'copy.md'))
+    assert (tmp_path / 'page.md').read_text(encoding='utf-8') == 'content'
+    assert file_mode(tmp_path / 'page.md') == 0o644
+    assert file_mode(tmp_path / 'copy.md') == 0o644
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith('.tmp-')] == []
+
+
+def test_atomic_write_keeps_existing_mode(tmp_path, umask_022):
+    """Tests if replacing a file keeps its mode."""
+    page = tmp_path / 'page.md'
+    page.write_text('old', encoding='utf-8')
+    os.chmod(page, 0o640)
+    atomic_write(str(page), 'new')
+    atomic_copy(str(page), str(page.with_name('copy.md')))
+    assert page.read_text(encoding='utf-8') == 'new'
+    assert file_mode(page) == 0o640
+    assert file_mode(page.with_name('copy.md')) == 0o644
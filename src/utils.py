@@ -1,4 +1,9 @@
+import hashlib
+import os
 import re
+import secrets
+import shutil
+import stat
 
 def camel_to_kebab(name):
     """
@@ -11,3 +16,83 @@ def camel_to_kebab(name):
     name = re.sub(r'([A-Z])([A-Z][a-z])', r'\1-\2', name)
     # Converts everything to lowercase
     return name.lower()
+
+
+def file_sha256(file_path, chunk_size=1024 * 1024):
+    """
+    Computes the SHA-256 hex digest of a file, reading it in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_sha256(text):
+    """
+    Computes the SHA-256 hex digest of a text encoded as UTF-8.
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _create_temp_file(file_path):
+    """
+    Creates an empty temporary file in the directory of a file, for a write renamed over it.
+    Unlike tempfile.mkstemp, which creates owner-only files, the temporary file gets the mode
+    of the file it replaces, or the mode the umask gives a new file.
+
+    :return: Tuple (file_descriptor, temp_path).
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    while True:
+        temp_path = os.path.join(directory, f".tmp-{secrets.token_hex(8)}-{os.path.basename(file_path)}")
+        try:
+            file_descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        os.chmod(temp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+    except FileNotFoundError:
+        pass
+    return file_descriptor, temp_path
+
+
+def atomic_write(file_path, content, encoding='utf-8'):
+    """
+    Writes a file through a temporary file in the same directory renamed over the target,
+    so readers and crashes never see a half-written file. Bytes content is written in binary mode.
+    """
+    file_descriptor, temp_path = _create_temp_file(file_path)
+    try:
+        if isinstance(content, bytes):
+            file = os.fdopen(file_descriptor, 'wb')
+        else:
+            file = os.fdopen(file_descriptor, 'w', encoding=encoding, newline='')
+        with file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def atomic_copy(source_path, destination_path):
+    """
+    Copies a file through a temporary file in the destination directory renamed over the target.
+    """
+    file_descriptor, temp_path = _create_temp_file(destination_path)
+    try:
+        with os.fdopen(file_descriptor, 'wb') as destination_file, open(source_path, 'rb') as source_file:
+            shutil.copyfileobj(source_file, destination_file)
+            destination_file.flush()
+            os.fsync(destination_file.fileno())
+        os.replace(temp_path, destination_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise